@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import hashlib
 import zlib
-from typing import Any, Iterable, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 RectNode = Tuple[Tuple[int, int, int, int], Any]
 
@@ -62,5 +62,85 @@ def smallest_hit(rect_nodes: Sequence[RectNode], x: int, y: int) -> Optional[Any
     return best_node
 
 
+def first_hit(rect_nodes: Sequence[RectNode], x: int, y: int) -> Optional[Any]:
+    # Expects rects sorted ascending by area (sort_rects_by_area): the first
+    # containing rect is then the smallest one, so the scan stops early.
+    if _native and hasattr(_native, "first_hit"):
+        return _native.first_hit(rect_nodes, int(x), int(y))
+
+    for rect, node in rect_nodes:
+        rx, ry, rw, rh = rect
+        if rw <= 0 or rh <= 0:
+            continue
+        if rx <= x <= (rx + rw) and ry <= y <= (ry + rh):
+            return node
+    return None
+
+
 def sort_rects_by_area(rect_nodes: Iterable[RectNode]) -> list[RectNode]:
     return sorted(rect_nodes, key=lambda item: (item[0][2] * item[0][3]))
+
+
+class HitGrid:
+    """Uniform-grid spatial index over area-sorted rects.
+
+    Each cell keeps the rects overlapping it (still ascending by area), so a
+    hover lookup scans one short bucket instead of the whole rect map. Bucket
+    entries hold precomputed edges, making each containment test four
+    comparisons. With an extent (x, y, w, h), rects are clipped to it before
+    their cells are listed, so bogus oversized bounds cannot fill the grid;
+    points outside the extent then never hit.
+    """
+
+    def __init__(
+        self,
+        rect_nodes: Iterable[RectNode],
+        cell_size: int = 128,
+        extent: Optional[Tuple[int, int, int, int]] = None,
+    ) -> None:
+        self.cell_size = max(1, int(cell_size))
+        self.cells: Dict[Tuple[int, int], List[Tuple[int, int, int, int, Any]]] = {}
+        cs = self.cell_size
+        if extent is not None:
+            ex1, ey1 = extent[0], extent[1]
+            ex2, ey2 = ex1 + extent[2], ey1 + extent[3]
+        for rect, node in rect_nodes:
+            rx, ry, rw, rh = rect
+            if rw <= 0 or rh <= 0:
+                continue
+            entry = (rx, ry, rx + rw, ry + rh, node)
+            x1, y1, x2, y2 = rx, ry, rx + rw, ry + rh
+            if extent is not None:
+                x1, y1 = max(x1, ex1), max(y1, ey1)
+                x2, y2 = min(x2, ex2), min(y2, ey2)
+                if x1 > x2 or y1 > y2:
+                    continue
+            for cx in range(x1 // cs, x2 // cs + 1):
+                for cy in range(y1 // cs, y2 // cs + 1):
+                    bucket = self.cells.get((cx, cy))
+                    if bucket is None:
+                        self.cells[(cx, cy)] = [entry]
+                    else:
+                        bucket.append(entry)
+
+    def hit(self, x: int, y: int) -> Optional[Any]:
+        cs = self.cell_size
+        bucket = self.cells.get((int(x) // cs, int(y) // cs))
+        if not bucket:
+            return None
+        for x1, y1, x2, y2, node in bucket:
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return node
+        return None
+
+
+def build_hit_grid(
+    rect_nodes: Iterable[RectNode],
+    cell_size: int = 128,
+    extent: Optional[Tuple[int, int, int, int]] = None,
+) -> HitGrid:
+    # Expects rects already sorted ascending by area (sort_rects_by_area),
+    # like first_hit; bucket order, and so the hit result, follows input order.
+    if _native and hasattr(_native, "build_hit_grid"):
+        return _native.build_hit_grid(rect_nodes, int(cell_size), extent)
+    return HitGrid(rect_nodes, cell_size=cell_size, extent=extent)
@@ -12,8 +12,199 @@ import json
 import time
 import shutil
 import re
+import shlex
+import struct
+import queue
+import threading
 from typing import List, Dict, Optional, Any
 
+
+class PersistentAdbShell:
+    """
+    Long-lived `adb shell` for text commands; AdbManager keeps one per device and calling thread.
+
+    Commands are written to the shell's stdin and the output is read up to a
+    per-command end marker carrying the exit status, so polling loops do not
+    spawn an adb process per query. Access is serialized with a lock.
+    """
+
+    def __init__(self, serial: str, argv: Optional[List[str]] = None):
+        self.serial = serial
+        self.argv = argv
+        self.proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    def _start(self) -> bool:
+        if self.proc and self.proc.poll() is None:
+            return True
+        argv = self.argv or AdbManager._apply_adb_server(['adb', '-s', self.serial, 'shell'])
+        startupinfo = None
+        if os.name == 'nt':
+            startupinfo = subprocess.STARTUPINFO()  # type: ignore
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW  # type: ignore
+        try:
+            self.proc = subprocess.Popen(
+                argv,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                startupinfo=startupinfo,
+                bufsize=0,
+            )
+        except Exception:
+            self.proc = None
+            return False
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self.proc, self._lines), daemon=True).start()
+        return True
+
+    @staticmethod
+    def _pump(proc: subprocess.Popen, lines: "queue.Queue[Optional[bytes]]") -> None:
+        # Blocking reads stay on this thread so run() can time out on the queue
+        try:
+            for line in iter(proc.stdout.readline, b""):
+                lines.put(line)
+        except Exception:
+            pass
+        lines.put(None)
+
+    def run(self, args: List[str], timeout: float = 10.0) -> Optional[subprocess.CompletedProcess]:
+        """
+        Runs a command in the shell. None only when the shell could not be started or
+        written to (the command never ran); a timeout or a shell that exits mid-command
+        yields a failed result with returncode -1, like AdbManager._run_cmd.
+        """
+        with self._lock:
+            if not self._start():
+                return None
+            self._seq += 1
+            marker = f"__QA_END_{self._seq}__"
+            # Split by an empty quoted string: a pty-backed shell that echoes the command
+            # line back must not show the marker itself
+            command = f'{shlex.join(args)} 2>&1; echo __QA_END_""{self._seq}__$?\n'
+            try:
+                self.proc.stdin.write(command.encode("utf-8"))
+                self.proc.stdin.flush()
+            except Exception:
+                self._close_locked()
+                return None
+            out: List[bytes] = []
+            deadline = time.monotonic() + timeout
+            marker_bytes = marker.encode("ascii")
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    line = None
+                if line is None:
+                    # Timed out or the shell died: drop it, the next call starts a fresh one.
+                    # Not rerun elsewhere: a hung command would just block for a second timeout
+                    self._close_locked()
+                    return subprocess.CompletedProcess(args, -1, "", f"shell command did not complete within {timeout}s")
+                idx = line.find(marker_bytes)
+                if idx != -1:
+                    # The terminator is the marker followed by the exit status only
+                    status = line[idx + len(marker_bytes):].strip()
+                    if status.isdigit():
+                        out.append(line[:idx])
+                        text = b"".join(out).decode("utf-8", errors="replace").replace("\r\n", "\n")
+                        return subprocess.CompletedProcess(args, int(status), text, "")
+                out.append(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        proc, self.proc = self.proc, None
+        if not proc:
+            return
+        try:
+            proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            proc.kill()
+            proc.wait(timeout=2)
+        except Exception:
+            pass
+
+
+class RawCaptureSession:
+    """
+    Long-lived `adb shell` that returns one raw framebuffer per `screencap` written to it.
+
+    Frames are framed by their own header (width, height, format), so only the
+    header length has to be known up front; it comes from a one-off raw capture.
+    Any malformed frame means the stream is out of sync (or the shell runs on a pty
+    that rewrites line endings), and the caller should close the session.
+    """
+
+    MAX_SIDE = 16384
+
+    def __init__(self, serial: str, header_size: int, display_id: Optional[str] = None,
+                 argv: Optional[List[str]] = None):
+        self.serial = serial
+        self.header_size = header_size
+        self.command = b"screencap -d %s 2>/dev/null\n" % display_id.encode() if display_id else b"screencap 2>/dev/null\n"
+        argv = argv or AdbManager._apply_adb_server(['adb', '-s', serial, 'shell'])
+        startupinfo = None
+        if os.name == 'nt':
+            startupinfo = subprocess.STARTUPINFO()  # type: ignore
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW  # type: ignore
+        # Large pipe buffer: a frame is several MB, read in as few syscalls as possible
+        self.proc = subprocess.Popen(
+            argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            startupinfo=startupinfo,
+            bufsize=1 << 20,
+        )
+
+    def capture(self) -> Optional[tuple[int, int, int, memoryview]]:
+        proc = self.proc
+        if proc is None or proc.poll() is not None:
+            return None
+        try:
+            proc.stdin.write(self.command)
+            proc.stdin.flush()
+            head = proc.stdout.read(12)
+            if len(head) != 12:
+                return None
+            w, h, fmt = struct.unpack("<III", head)
+            if fmt not in (1, 2, 5) or not (0 < w <= self.MAX_SIDE and 0 < h <= self.MAX_SIDE):
+                return None
+            buf = bytearray(self.header_size - 12 + w * h * 4)
+            view = memoryview(buf)
+            got = 0
+            while got < len(buf):
+                n = proc.stdout.readinto(view[got:])
+                if not n:
+                    return None
+                got += n
+        except Exception:
+            return None
+        return w, h, fmt, view[self.header_size - 12:]
+
+    def close(self) -> None:
+        proc, self.proc = self.proc, None
+        if not proc:
+            return
+        try:
+            proc.stdin.write(b"exit\n")
+            proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            proc.kill()
+            proc.wait(timeout=2)
+        except Exception:
+            pass
+
+
 class AdbManager:
     """
     Static utility class for ADB operations.
@@ -24,6 +215,12 @@ class AdbManager:
     _last_dump_error: Optional[str] = None
     _display_size_cache: Dict[str, tuple[int, int]] = {}
     _uiautomator_service_cache: Dict[str, bool] = {}
+    # Keyed by (serial, thread id): a multi-second UI dump on one polling thread
+    # must not hold up focus/activity queries running on another
+    _shells: Dict[tuple, PersistentAdbShell] = {}
+    _raw_screencap_unsupported: set = set()
+    _raw_header_size: Dict[str, int] = {}
+    _shells_lock = threading.Lock()
 
     @staticmethod
     def _normalize_serial(serial: str) -> str:
@@ -35,11 +232,14 @@ class AdbManager:
     def set_adb_server(host: str, port: int = 5037) -> None:
         AdbManager._adb_host = host
         AdbManager._adb_port = port
+        # Open shells were started against the previous server
+        AdbManager.close_shells()
 
     @staticmethod
     def clear_adb_server() -> None:
         AdbManager._adb_host = None
         AdbManager._adb_port = None
+        AdbManager.close_shells()
 
     @staticmethod
     def _resolve_adb() -> Optional[str]:
@@ -86,6 +286,41 @@ class AdbManager:
         res = AdbManager._run_cmd(["adb", "-s", serial, "shell", *args], timeout=timeout)
         return (res.stdout or res.stderr or "").strip()
 
+    @staticmethod
+    def _run_shell(serial: str, args: List[str], timeout: int = 10) -> subprocess.CompletedProcess:
+        """
+        Runs a short text command through the device's persistent shell.
+        Falls back to a one-off `adb shell` process if the persistent shell is unavailable.
+        stdout and stderr are merged.
+        """
+        serial = AdbManager._normalize_serial(serial)
+        res = AdbManager._shell_for(serial).run(args, timeout=timeout)
+        if res is not None:
+            return res
+        return AdbManager._run_cmd(['adb', '-s', serial, 'shell', *args], timeout=timeout)
+
+    @staticmethod
+    def _shell_for(serial: str) -> PersistentAdbShell:
+        """The calling thread's persistent shell for the device."""
+        key = (serial, threading.get_ident())
+        with AdbManager._shells_lock:
+            sh = AdbManager._shells.get(key)
+            if sh is None:
+                sh = AdbManager._shells[key] = PersistentAdbShell(serial)
+        return sh
+
+    @staticmethod
+    def close_shells(serial: Optional[str] = None) -> None:
+        with AdbManager._shells_lock:
+            if serial is None:
+                shells = list(AdbManager._shells.values())
+                AdbManager._shells.clear()
+            else:
+                serial = AdbManager._normalize_serial(serial)
+                shells = [AdbManager._shells.pop(key) for key in list(AdbManager._shells) if key[0] == serial]
+        for sh in shells:
+            sh.close()
+
     @staticmethod
     def _run_bytes_cmd(cmd: List[str]) -> Optional[subprocess.CompletedProcess]:
         """
@@ -260,6 +495,66 @@ class AdbManager:
             AdbManager._best_display_id[serial] = best_id
         return best_bytes
 
+    @staticmethod
+    def parse_raw_screencap(data: bytes) -> Optional[tuple[int, int, int, memoryview]]:
+        """
+        Splits `screencap` raw output into (width, height, pixel_format, pixels).
+
+        The header is width, height and format as little-endian uint32, followed by
+        a uint32 dataspace on Android 9+; the header length is inferred from the size.
+        Returns None for anything but RGBA_8888 (1), RGBX_8888 (2) or BGRA_8888 (5).
+        """
+        if not data or len(data) < 12:
+            return None
+        w, h, fmt = struct.unpack_from("<III", data, 0)
+        pixels = w * h * 4
+        if w <= 0 or h <= 0 or fmt not in (1, 2, 5):
+            return None
+        for header in (16, 12):
+            if len(data) == header + pixels:
+                return w, h, fmt, memoryview(data)[header:]
+        return None
+
+    @staticmethod
+    def get_screenshot_raw(serial: str) -> Optional[tuple[int, int, int, memoryview]]:
+        """
+        Captures the framebuffer without on-device PNG encoding.
+
+        Only used for USB devices: a raw frame is several times larger than the PNG,
+        which costs more than the encode over a network connection. Returns None when
+        raw capture is unavailable, after which the device stays on PNG capture.
+        """
+        serial = AdbManager._normalize_serial(serial)
+        if ":" in serial or serial in AdbManager._raw_screencap_unsupported:
+            return None
+        cmd = ['adb', '-s', serial, 'exec-out', 'screencap']
+        display_id = AdbManager._preferred_display_id.get(serial) or AdbManager._best_display_id.get(serial)
+        if display_id:
+            cmd += ['-d', display_id]
+        res = AdbManager._run_bytes_cmd(cmd)
+        frame = AdbManager.parse_raw_screencap(res.stdout) if res and res.returncode == 0 else None
+        if frame is None:
+            AdbManager._raw_screencap_unsupported.add(serial)
+        else:
+            AdbManager._raw_header_size[serial] = len(res.stdout) - len(frame[3])
+        return frame
+
+    @staticmethod
+    def open_capture_session(serial: str) -> Optional[RawCaptureSession]:
+        """
+        Opens a persistent raw capture stream once a one-off raw capture has
+        succeeded for the device (which also fixes the header length).
+        """
+        serial = AdbManager._normalize_serial(serial)
+        header_size = AdbManager._raw_header_size.get(serial)
+        if not header_size or serial in AdbManager._raw_screencap_unsupported:
+            return None
+        display_id = AdbManager._preferred_display_id.get(serial) or AdbManager._best_display_id.get(serial)
+        try:
+            return RawCaptureSession(serial, header_size, display_id)
+        except Exception:
+            return None
+
     @staticmethod
     def get_display_ids(serial: str) -> List[str]:
         """
@@ -486,14 +781,14 @@ class AdbManager:
                 display_candidates.append(str(disp))
 
         def read_existing() -> Optional[str]:
-            check = AdbManager._run_cmd(['adb', '-s', serial, 'shell', 'du', '-b', temp_path])
+            check = AdbManager._run_shell(serial, ['du', '-b', temp_path])
             size = 0
             try:
                 size = int((check.stdout or "").split()[0])
             except (IndexError, ValueError):
                 size = 0
             if size >= 200:
-                res_cat = AdbManager._run_cmd(['adb', '-s', serial, 'exec-out', 'cat', temp_path])
+                res_cat = AdbManager._run_shell(serial, ['cat', temp_path])
                 xml = (res_cat.stdout or "").strip()
                 if xml and "<hierarchy" in xml:
                     return xml
@@ -504,15 +799,15 @@ class AdbManager:
         def try_dump(disp: Optional[str], compressed: bool) -> Optional[str]:
             # Delete old first to ensure we don't read stale data (unless service missing)
             if service_available:
-                AdbManager._run_cmd(['adb', '-s', serial, 'shell', 'rm', temp_path])
+                AdbManager._run_shell(serial, ['rm', temp_path])
 
-            dump_cmd = ['adb', '-s', serial, 'shell', 'uiautomator', 'dump']
+            dump_cmd = ['uiautomator', 'dump']
             if compressed:
                 dump_cmd += ['--compressed']
             if disp:
                 dump_cmd += ['--display-id', str(disp)]
             dump_cmd += [temp_path]
-            res = AdbManager._run_cmd(dump_cmd, timeout=20)
+            res = AdbManager._run_shell(serial, dump_cmd, timeout=20)
             out = ((res.stdout or "") + (res.stderr or "")).lower()
             if res.returncode and res.returncode != 0:
                 if res.returncode == 137:
@@ -522,7 +817,7 @@ class AdbManager:
             if "killed" in out:
                 AdbManager._last_dump_error = "uiautomator dump was killed by device"
 
-            check = AdbManager._run_cmd(['adb', '-s', serial, 'shell', 'du', '-b', temp_path])
+            check = AdbManager._run_shell(serial, ['du', '-b', temp_path])
             size = 0
             try:
                 size = int((check.stdout or "").split()[0])
@@ -530,7 +825,7 @@ class AdbManager:
                 size = 0
 
             if size >= 200:
-                res_cat = AdbManager._run_cmd(['adb', '-s', serial, 'exec-out', 'cat', temp_path])
+                res_cat = AdbManager._run_shell(serial, ['cat', temp_path])
                 xml = (res_cat.stdout or "").strip()
                 if xml and "<hierarchy" in xml:
                     return xml
@@ -558,14 +853,14 @@ class AdbManager:
             return None
 
         def try_cmd_dump(disp: Optional[str], compressed: bool) -> Optional[str]:
-            AdbManager._run_cmd(['adb', '-s', serial, 'shell', 'rm', temp_path])
-            cmd = ['adb', '-s', serial, 'shell', 'cmd', 'uiautomator', 'dump']
+            AdbManager._run_shell(serial, ['rm', temp_path])
+            cmd = ['cmd', 'uiautomator', 'dump']
             if compressed:
                 cmd += ['--compressed']
             if disp:
                 cmd += ['--display-id', str(disp)]
             cmd += [temp_path]
-            res = AdbManager._run_cmd(cmd, timeout=20)
+            res = AdbManager._run_shell(serial, cmd, timeout=20)
             out = ((res.stdout or "") + (res.stderr or "")).lower()
             if res.returncode and res.returncode != 0:
                 if res.returncode == 137:
@@ -575,14 +870,14 @@ class AdbManager:
             if "killed" in out:
                 AdbManager._last_dump_error = "cmd uiautomator dump was killed by device"
 
-            check = AdbManager._run_cmd(['adb', '-s', serial, 'shell', 'du', '-b', temp_path])
+            check = AdbManager._run_shell(serial, ['du', '-b', temp_path])
             size = 0
             try:
                 size = int((check.stdout or "").split()[0])
             except (IndexError, ValueError):
                 size = 0
             if size >= 200:
-                res_cat = AdbManager._run_cmd(['adb', '-s', serial, 'exec-out', 'cat', temp_path])
+                res_cat = AdbManager._run_shell(serial, ['cat', temp_path])
                 xml = (res_cat.stdout or "").strip()
                 if xml and "<hierarchy" in xml:
                     return xml
@@ -680,16 +975,15 @@ class AdbManager:
         try:
             # dumpsys window displays
             serial = AdbManager._normalize_serial(serial)
-            cmd = ['adb', '-s', serial, 'shell', 'dumpsys', 'window', 'windows']
-            res = AdbManager._run_cmd(cmd)
+            res = AdbManager._run_shell(serial, ['dumpsys', 'window', 'windows'])
             for line in res.stdout.split('\n'):
                 if 'mCurrentFocus' in line or 'mFocusedApp' in line:
                     return line.strip()
-            res2 = AdbManager._run_cmd(['adb', '-s', serial, 'shell', 'dumpsys', 'activity', 'top'])
+            res2 = AdbManager._run_shell(serial, ['dumpsys', 'activity', 'top'])
             for line in res2.stdout.split('\n'):
                 if 'mResumedActivity' in line or 'mFocusedActivity' in line or 'ResumedActivity' in line:
                     return line.strip()
-            res3 = AdbManager._run_cmd(['adb', '-s', serial, 'shell', 'dumpsys', 'activity', 'activities'])
+            res3 = AdbManager._run_shell(serial, ['dumpsys', 'activity', 'activities'])
             for line in res3.stdout.split('\n'):
                 if 'mResumedActivity' in line or 'mFocusedActivity' in line or 'ResumedActivity' in line:
                     return line.strip()
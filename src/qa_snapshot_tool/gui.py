@@ -4,7 +4,7 @@ Main GUI Module.
 This module implements the MainWindow class, which is the central hub of the desktop application.
 It orchestrates the various docks, views, and controllers, including:
 - Screenshot visualization (QGraphicsView)
-- Hierarchy tree (QTreeWidget)
+- Hierarchy tree (QTreeView over a lazy UiNode model)
 - Node property inspection
 - Device control and snapshot capture
 """
@@ -16,6 +16,7 @@ import math
 import re
 import shutil
 import threading
+from collections import deque
 import urllib.request
 import subprocess
 import sqlite3
@@ -23,19 +24,20 @@ from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Dict, Optional, List, Any
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTreeWidget, QTreeWidgetItem,
-    QGraphicsView, QGraphicsScene, QGraphicsRectItem, QFileDialog, QTextEdit,
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTreeView,
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsLineItem, QFileDialog, QTextEdit, QPlainTextEdit,
     QGroupBox, QComboBox, QTableWidget, QTableWidgetItem, QHeaderView,
     QToolBar, QTabWidget, QStatusBar, QFrame, QDockWidget, QApplication, QLineEdit, QCheckBox, QMessageBox,
     QMenu, QToolButton, QScrollArea, QAbstractItemView, QListWidget
 )
-from PySide6.QtGui import QPixmap, QPen, QBrush, QImage, QColor, QAction, QPainter, QCursor, QLinearGradient, QPalette, QGuiApplication
+from PySide6.QtGui import QPixmap, QPen, QBrush, QImage, QImageReader, QColor, QAction, QPainter, QCursor, QLinearGradient, QPalette, QGuiApplication, QFontMetricsF, QTransform, QStandardItemModel, QStandardItem, QPixmapCache
 from PySide6.QtCore import QUrl
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput, QVideoSink
-from PySide6.QtCore import Qt, QRectF, Signal, QTimer
+from PySide6.QtCore import Qt, QRectF, QSize, Signal, QTimer, QObject, QRunnable, QThreadPool
 
 from qa_snapshot_tool.utils import get_app_root
 from qa_snapshot_tool.uix_parser import UixParser
+from qa_snapshot_tool.uix_tree_model import UixTreeModel
 from qa_snapshot_tool.locator_suggester import LocatorSuggester
 from qa_snapshot_tool.adb_manager import AdbManager
 from qa_snapshot_tool.live_mirror import VideoThread, ScrcpyVideoSource, HierarchyThread, LogcatThread, FocusMonitorThread
@@ -45,7 +47,15 @@ from qa_snapshot_tool.device_profiles import DeviceCapabilities, detect_capabili
 from qa_snapshot_tool.session_recorder import SessionRecorder
 from qa_snapshot_tool.maestro_handoff import export_session_handoff
 from qa_snapshot_tool.perf_metrics import PerfTracker
-from qa_snapshot_native import backend_name as native_backend_name, smallest_hit, sort_rects_by_area
+from qa_snapshot_tool import snapshot_cache
+from qa_snapshot_native import backend_name as native_backend_name, build_hit_grid, first_hit, smallest_hit, sort_rects_by_area
+
+# Locator output templates, keyed by the Smart Selectors format combo text
+LOCATOR_FORMATS = {
+    "Python (Appium)": 'driver.find_element(AppiumBy.XPATH, "{}")',
+    "Java (By.xpath)": 'driver.findElement(By.xpath("{}"));',
+    "Raw XPath": "{}",
+}
 
 
 @dataclass
@@ -65,6 +75,8 @@ class DeviceWorkspace:
     dump_bounds: Optional[tuple[int, int, int, int]] = None
     device_bounds: Optional[tuple[int, int, int, int]] = None
     last_xml: str = ""
+    # (root, parse_error) for last_xml; the tree is never mutated, so a switch back reuses it
+    last_tree: Optional[tuple] = None
     log_lines: List[str] = field(default_factory=list)
     focus_text: str = "-"
     last_snapshot_path: Optional[str] = None
@@ -72,6 +84,72 @@ class DeviceWorkspace:
     environment_type: str = "rack"
     profile: str = "rack_aaos"
 
+class OutlineRectItem(QGraphicsItem):
+    """Rectangle outline built from four edge items.
+
+    A QGraphicsRectItem's bounding rect covers its whole area, so moving a
+    screen-sized selection repaints everything beneath it. Here each edge is
+    its own thin item and only those strips are invalidated.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFlag(QGraphicsItem.ItemHasNoContents, True)
+        self._edges = [QGraphicsLineItem(self) for _ in range(4)]
+
+    def boundingRect(self) -> QRectF:
+        return QRectF()
+
+    def paint(self, painter, option, widget=None) -> None:
+        pass
+
+    def setPen(self, pen) -> None:
+        for edge in self._edges:
+            edge.setPen(pen)
+
+    def setRect(self, rect: QRectF) -> None:
+        l, t, r, b = rect.left(), rect.top(), rect.right(), rect.bottom()
+        top, bottom, left, right = self._edges
+        top.setLine(l, t, r, t)
+        bottom.setLine(l, b, r, b)
+        left.setLine(l, t, l, b)
+        right.setLine(r, t, r, b)
+
+class SnapshotDecodeSignals(QObject):
+    decoded = Signal(int, object) # (request token, QImage)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.latest_token = 0 # read by queued tasks to skip superseded work
+
+class SnapshotDecodeTask(QRunnable):
+    """Decodes a snapshot screenshot on the thread pool, scaling while reading."""
+
+    def __init__(self, path: str, scaled_size: QSize, token: int, signals: SnapshotDecodeSignals):
+        super().__init__()
+        self.path = path
+        self.scaled_size = QSize(scaled_size)
+        self.token = token
+        self.signals = signals
+
+    def run(self) -> None:
+        if self.token != self.signals.latest_token:
+            return
+        size = self.scaled_size
+        cached = snapshot_cache.image_path(self.path, size.width(), size.height())
+        img = snapshot_cache.load_image(cached) if cached else None
+        if img is None:
+            reader = QImageReader(self.path)
+            if size.isValid():
+                reader.setScaledSize(size)
+            img = reader.read()
+            if cached and not img.isNull():
+                snapshot_cache.store_image(cached, img)
+        try:
+            self.signals.decoded.emit(self.token, img)
+        except RuntimeError:
+            pass # window closed while decoding
+
 class SmartGraphicsView(QGraphicsView):
     mouse_moved = Signal(int, int)
     input_tap = Signal(int, int)
@@ -85,11 +163,41 @@ class SmartGraphicsView(QGraphicsView):
         self.setRenderHint(QPainter.Antialiasing)
         self.setFrameShape(QFrame.NoFrame)
         self.setBackgroundBrush(QBrush(QColor(Theme.BG_DARK)))
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
         
         self.click_enabled = True
         self.control_enabled = False
         self._drag_start = None
         self.crosshair_pos = None # Scene coordinates
+        self._last_crosshair_pos = None # Last painted crosshair (scene coordinates)
+        self._crosshair_update_pending = False
+        # Used on every crosshair repaint; built once
+        self._crosshair_pen = QPen(QColor(Theme.ACCENT_YELLOW), 1, Qt.DashLine)
+        self._label_pen = QPen(QColor(Theme.TEXT_WHITE), 1)
+
+    def set_opengl_enabled(self, enabled: bool) -> bool:
+        """
+        Swaps the viewport between a QOpenGLWidget (GPU blits) and the default raster widget.
+        Returns True if the OpenGL viewport is active afterwards.
+        """
+        viewport: QWidget
+        if enabled:
+            try:
+                from PySide6.QtOpenGLWidgets import QOpenGLWidget
+                viewport = QOpenGLWidget()
+            except Exception:
+                enabled = False
+                viewport = QWidget()
+        else:
+            viewport = QWidget()
+        self.setViewport(viewport)
+        # Fresh viewports start untracked; hover inspection needs plain moves
+        viewport.setMouseTracking(True)
+        # GL viewports cannot do partial updates
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate if enabled else QGraphicsView.MinimalViewportUpdate)
+        viewport.setAutoFillBackground(True)
+        viewport.setStyleSheet(f"background-color: {Theme.BG_DARK};")
+        return enabled
 
     def wheelEvent(self, event):
         if event.modifiers() & Qt.ControlModifier:
@@ -132,12 +240,44 @@ class SmartGraphicsView(QGraphicsView):
         scene_pos = self.mapToScene(event.pos())
         self.crosshair_pos = scene_pos
         self.mouse_moved.emit(int(scene_pos.x()), int(scene_pos.y()))
-        self.viewport().update() # Trigger repaint
+        # Coalesce moves to one repaint per frame (~60 Hz)
+        if not self._crosshair_update_pending:
+            self._crosshair_update_pending = True
+            QTimer.singleShot(16, self._flush_crosshair)
         super().mouseMoveEvent(event)
 
+    def _crosshair_rects(self, pos) -> List[QRectF]:
+        # Scene-space strips covered by the crosshair lines and coordinate label
+        scene_rect = self.sceneRect()
+        t = self.transform()
+        pad_x = 2.0 / max(1e-6, abs(t.m11()))
+        pad_y = 2.0 / max(1e-6, abs(t.m22()))
+        x = pos.x()
+        y = pos.y()
+        label = QFontMetricsF(self.font()).boundingRect(f"({int(x)}, {int(y)})")
+        label.translate(x + 10, y - 10)
+        return [
+            QRectF(x - pad_x, scene_rect.top(), 2 * pad_x, scene_rect.height()),
+            QRectF(scene_rect.left(), y - pad_y, scene_rect.width(), 2 * pad_y),
+            label.adjusted(-pad_x, -pad_y, pad_x, pad_y),
+        ]
+
+    def _flush_crosshair(self) -> None:
+        self._crosshair_update_pending = False
+        scene = self.scene()
+        if scene is None:
+            return
+        # Erase the previous crosshair and paint the new one; only the strips are repainted
+        for pos in (self._last_crosshair_pos, self.crosshair_pos):
+            if pos is None:
+                continue
+            for rect in self._crosshair_rects(pos):
+                scene.invalidate(rect, QGraphicsScene.ForegroundLayer)
+        self._last_crosshair_pos = self.crosshair_pos
+
     def drawForeground(self, painter, rect):
         if self.crosshair_pos:
-            painter.setPen(QPen(QColor(Theme.ACCENT_YELLOW), 1, Qt.DashLine))
+            painter.setPen(self._crosshair_pen)
             x = self.crosshair_pos.x()
             y = self.crosshair_pos.y()
             
@@ -148,7 +288,7 @@ class SmartGraphicsView(QGraphicsView):
             
             # Draw coordinates text
             text = f"({int(x)}, {int(y)})"
-            painter.setPen(QPen(QColor(Theme.TEXT_WHITE), 1))
+            painter.setPen(self._label_pen)
             painter.drawText(x + 10, y - 10, text)
             
         super().drawForeground(painter, rect)
@@ -191,13 +331,18 @@ class MainWindow(QMainWindow):
         self.workspace_serials: List[str] = []
         self.active_workspace_serial: Optional[str] = None
         self.perf = PerfTracker()
-        self.last_hover_ts = 0.0
+        self.hover_pending_node = None
+        self.hover_select_pending = False
         self.rect_map_sorted = []
+        self.rect_grid = None
+        self.rendered_xml: Optional[str] = None
+        self.selector_node = None
+        self.locator_text_cache: Dict[str, str] = {}
+        self.locator_cache_by_node: Dict[int, tuple] = {}
+        self.locator_text_shown = ""
         self.timeline_event_file_paths: Dict[int, str] = {}
         self.timeline_event_payloads: Dict[int, str] = {}
 
-        self.current_node_map = {}
-        self.node_to_item_map = {}
         self.rect_map = []
         self.active_device = None
         self.root_node = None
@@ -237,6 +382,15 @@ class MainWindow(QMainWindow):
         self.device_bounds = None
         self.last_frame_size = None
         self.last_frame_image = None
+        self.frame_paint_pending = False
+        self.pending_frame = None
+        self.snapshot_png: Optional[str] = None
+        self.snapshot_source_size = QSize()
+        self.snapshot_decode_size = QSize()
+        self.snapshot_decode_token = 0
+        self.snapshot_pixmap_key: Optional[str] = None
+        self.snapshot_decoder = SnapshotDecodeSignals()
+        self.snapshot_decoder.decoded.connect(self.on_snapshot_decoded)
         self.live_source = "ADB"
         self.scrcpy_path = ""
         self.selected_display_id = None
@@ -248,6 +402,8 @@ class MainWindow(QMainWindow):
         self.prefer_raw_scrcpy = True
         self._initial_resize_done = False
         self.syslog_auto_scroll = True
+        # Capped like txt_log's block count; older lines would be dropped on display anyway
+        self.log_buffer = deque(maxlen=5000)
         
         self.setup_ui()
         self.refresh_devices()
@@ -261,6 +417,11 @@ class MainWindow(QMainWindow):
         self.ambient_timer = QTimer()
         self.ambient_timer.timeout.connect(self.update_ambient)
 
+        # Logcat lines are buffered and appended in one block per tick
+        self.log_flush_timer = QTimer()
+        self.log_flush_timer.timeout.connect(self.flush_log_buffer)
+        self.log_flush_timer.start(100)
+
     def showEvent(self, event):
         super().showEvent(event)
         if self._initial_resize_done:
@@ -326,6 +487,8 @@ class MainWindow(QMainWindow):
         
         # View
         self.scene = QGraphicsScene()
+        # Only a pixmap and an overlay rect live here; a BSP index just adds upkeep on every overlay move
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.view = SmartGraphicsView(self.scene)
         self.view.setStyleSheet(f"background-color: {Theme.BG_DARK};")
         self.view.setBackgroundBrush(QBrush(QColor(Theme.BG_DARK)))
@@ -333,6 +496,8 @@ class MainWindow(QMainWindow):
         self.view.viewport().setStyleSheet(f"background-color: {Theme.BG_DARK};")
         self.view.setAttribute(Qt.WA_OpaquePaintEvent, True)
         self.view.setBackgroundBrush(QBrush(QColor(Theme.BG_DARK)))
+        if self.settings.opengl_viewport:
+            self.settings.opengl_viewport = self.view.set_opengl_enabled(True)
         self.view.mouse_moved.connect(self.on_mouse_hover)
         self.view.input_tap.connect(self.handle_tap)
         self.view.input_swipe.connect(self.handle_swipe)
@@ -360,8 +525,10 @@ class MainWindow(QMainWindow):
             self.init_ambient_video()
 
         # Overlay Items
-        self.rect_item = QGraphicsRectItem()
-        self.rect_item.setPen(QPen(QColor(Theme.BMW_BLUE), 3))
+        self.overlay_pen = QPen(QColor(Theme.BMW_BLUE), 3)
+        self.locked_overlay_pen = QPen(QColor(Theme.ACCENT_YELLOW), 3)
+        self.rect_item = OutlineRectItem()
+        self.rect_item.setPen(self.overlay_pen)
         self.rect_item.setZValue(99)
         self.scene.addItem(self.rect_item); self.rect_item.hide()
         self.pixmap_item = None
@@ -568,7 +735,12 @@ class MainWindow(QMainWindow):
         self.chk_perf.stateChanged.connect(self.toggle_perf_mode)
         self.chk_perf.setToolTip("Reduce UI tree refresh rate while live streaming.")
 
-        ol.addWidget(self.chk_auto_follow); ol.addWidget(self.chk_ambient); ol.addWidget(self.chk_perf)
+        self.chk_opengl = QCheckBox("GPU Viewport (OpenGL)")
+        self.chk_opengl.setChecked(self.settings.opengl_viewport)
+        self.chk_opengl.stateChanged.connect(self.toggle_opengl_viewport)
+        self.chk_opengl.setToolTip("Render the live view through OpenGL. Faster on high-resolution streams; disable if the view stays black.")
+
+        ol.addWidget(self.chk_auto_follow); ol.addWidget(self.chk_ambient); ol.addWidget(self.chk_perf); ol.addWidget(self.chk_opengl)
         gb_opts.setLayout(ol); l.addWidget(gb_opts)
         
         l.addStretch()
@@ -586,7 +758,7 @@ class MainWindow(QMainWindow):
 
         lbl_ws = QLabel("Workspaces")
         lbl_ws.setObjectName("h2")
-        self.list_workspaces = QListWidget()
+        self.list_workspaces = QListWidget(); self.list_workspaces.setUniformItemSizes(True)
         self.list_workspaces.setToolTip("Workspace navigator. Click to activate a device workspace.")
         self.list_workspaces.itemSelectionChanged.connect(self.on_workspace_list_selected)
 
@@ -600,7 +772,7 @@ class MainWindow(QMainWindow):
 
         lbl_sessions = QLabel("Recent Sessions")
         lbl_sessions.setObjectName("h2")
-        self.list_sessions = QListWidget()
+        self.list_sessions = QListWidget(); self.list_sessions.setUniformItemSizes(True)
         self.list_sessions.setToolTip("Recorded sessions. Click to select in Timeline.")
         self.list_sessions.itemSelectionChanged.connect(self.on_navigator_session_selected)
 
@@ -626,9 +798,12 @@ class MainWindow(QMainWindow):
         d = QDockWidget("Hierarchy", self)
         self.dock_tree = d
         self.register_ambient_widget(d)
-        self.tree = QTreeWidget(); self.tree.setHeaderLabel("UI Tree")
-        self.tree.itemClicked.connect(self.on_tree_click)
-        self.tree.currentItemChanged.connect(self.on_tree_current_changed)
+        self.tree = QTreeView(); self.tree.setUniformRowHeights(True)
+        self.tree_model = UixTreeModel("UI Tree")
+        self.tree_placeholder_model = QStandardItemModel()
+        self.tree_selection_syncing = False
+        self.show_tree_model(self.tree_model)
+        self.tree.clicked.connect(self.on_tree_click)
         self.tree.setToolTip("UI hierarchy. Use arrow keys to navigate; Enter to lock/unlock selection.")
         d.setWidget(self.wrap_ambient_panel(self.tree)); self.addDockWidget(Qt.RightDockWidgetArea, d)
 
@@ -640,7 +815,10 @@ class MainWindow(QMainWindow):
         # Properties Tab (The one missing data in your screenshot)
         self.tbl_props = QTableWidget(); self.tbl_props.setColumnCount(2)
         self.tbl_props.setHorizontalHeaderLabels(["Property", "Value"])
-        self.tbl_props.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Fixed-policy columns: only the last one fills the remaining width
+        self.tbl_props.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.tbl_props.horizontalHeader().setStretchLastSection(True)
+        self.tbl_props.setColumnWidth(0, 120)
         self.tbl_props.verticalHeader().setVisible(False)
         self.tbl_props.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.tbl_props.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
@@ -658,7 +836,8 @@ class MainWindow(QMainWindow):
         tabs.addTab(w_loc, "Smart Selectors")
         
         # Logcat Tab
-        self.txt_log = QTextEdit(); self.txt_log.setReadOnly(True)
+        self.txt_log = QPlainTextEdit(); self.txt_log.setReadOnly(True)
+        self.txt_log.setMaximumBlockCount(5000)
         self.txt_log.setToolTip("Live device log output. Offline snapshots load logcat.txt here.")
         tabs.addTab(self.txt_log, "Logcat")
 
@@ -682,7 +861,10 @@ class MainWindow(QMainWindow):
         self.tbl_timeline = QTableWidget()
         self.tbl_timeline.setColumnCount(4)
         self.tbl_timeline.setHorizontalHeaderLabels(["Time", "Type", "File", "Payload"])
-        self.tbl_timeline.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.tbl_timeline.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.tbl_timeline.horizontalHeader().setStretchLastSection(True)
+        for col, width in enumerate((90, 110, 180)):
+            self.tbl_timeline.setColumnWidth(col, width)
         self.tbl_timeline.verticalHeader().setVisible(False)
         self.tbl_timeline.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.tbl_timeline.itemSelectionChanged.connect(self.on_timeline_selection_changed)
@@ -1267,7 +1449,7 @@ class MainWindow(QMainWindow):
             self.btn_live.setText("START LIVE STREAM")
             self.btn_live.setProperty("class", "primary")
             self.polish_btn(self.btn_live)
-            self.txt_log.setText("")
+            self.set_log_text("")
             self.lbl_focus.setText("Focus: -")
             self._apply_capability_state()
             self.log_sys(f"Workspace removed: {serial}")
@@ -1317,7 +1499,8 @@ class MainWindow(QMainWindow):
         self._apply_capability_state()
 
     def _store_workspace_view_state(self, ws: DeviceWorkspace) -> None:
-        ws.last_frame_image = self.last_frame_image.copy() if self.last_frame_image and not self.last_frame_image.isNull() else ws.last_frame_image
+        # Shared, not deep-copied: live frames are never painted into
+        ws.last_frame_image = self.last_frame_image if self.last_frame_image and not self.last_frame_image.isNull() else ws.last_frame_image
         ws.last_frame_size = self.last_frame_size
         ws.stream_scale = self.stream_scale
         ws.dump_bounds = self.dump_bounds
@@ -1326,7 +1509,7 @@ class MainWindow(QMainWindow):
         ws.last_handoff_manifest = self.last_handoff_manifest
 
     def _load_workspace_view_state(self, ws: DeviceWorkspace) -> None:
-        self.last_frame_image = ws.last_frame_image.copy() if ws.last_frame_image and not ws.last_frame_image.isNull() else None
+        self.last_frame_image = ws.last_frame_image if ws.last_frame_image and not ws.last_frame_image.isNull() else None
         self.last_frame_size = ws.last_frame_size
         self.stream_scale = ws.stream_scale if ws.stream_scale else 1.0
         self.dump_bounds = ws.dump_bounds
@@ -1338,18 +1521,22 @@ class MainWindow(QMainWindow):
             if self.pixmap_item:
                 self.scene.removeItem(self.pixmap_item)
                 self.pixmap_item = None
+            self.snapshot_png = None
+            self.pending_frame = None
             self.rect_item.hide()
 
         if ws.last_xml:
-            self.on_tree_data(ws.last_xml, True)
+            self.on_tree_data(ws.last_xml, True, parsed=ws.last_tree)
         else:
-            self.tree.clear()
-            self.current_node_map = {}
-            self.node_to_item_map = {}
+            self.tree_model.set_root(None)
+            self.show_tree_model(self.tree_model)
             self.rect_map = []
+            self.rect_map_sorted = []
+            self.rect_grid = None
+            self.rendered_xml = None
             self.tbl_props.setRowCount(0)
 
-        self.txt_log.setText("\n".join(ws.log_lines[-5000:]))
+        self.set_log_text("\n".join(ws.log_lines[-5000:]))
         self.lbl_focus.setText(f"Focus: {ws.focus_text}")
 
     def _apply_background_scheduler(self) -> None:
@@ -1445,7 +1632,7 @@ class MainWindow(QMainWindow):
         if not self._require_capability(ws, "supports_screencap", "Live start"):
             return
 
-        self.txt_log.setText("Starting logcat...")
+        self.set_log_text("Starting logcat...")
         target_fps = 4 if self.perf_mode else 8
         source_text = self.combo_live_source.currentText() if hasattr(self, "combo_live_source") else "Scrcpy (fast)"
         if "Scrcpy" in source_text:
@@ -1475,6 +1662,7 @@ class MainWindow(QMainWindow):
                 server_path=scrcpy_server or None,
             )
             ws.video_thread.log_line.connect(lambda line, s=serial: self.on_workspace_log_line(s, line, source="scrcpy"))
+            ws.video_thread.log_lines.connect(lambda lines, s=serial: self.on_workspace_log_lines(s, lines, source="scrcpy"))
             self.log_sys(f"Live source: Scrcpy (fast) | {serial} | bin: {self.scrcpy_path}")
             if scrcpy_server:
                 self.log_sys(f"Scrcpy server: {scrcpy_server}")
@@ -1487,7 +1675,7 @@ class MainWindow(QMainWindow):
 
         if caps.supports_uia_dump:
             ws.xml_thread = HierarchyThread(serial)
-            ws.xml_thread.tree_ready.connect(lambda xml, changed, s=serial: self.on_workspace_tree(s, xml, changed))
+            ws.xml_thread.tree_ready.connect(lambda xml, changed, parsed, s=serial: self.on_workspace_tree(s, xml, changed, parsed))
             ws.xml_thread.dump_error.connect(lambda msg, s=serial: self.on_workspace_dump_error(s, msg))
             ws.xml_thread.start()
         else:
@@ -1498,7 +1686,7 @@ class MainWindow(QMainWindow):
             )
 
         ws.log_thread = LogcatThread(serial)
-        ws.log_thread.log_line.connect(lambda line, s=serial: self.on_workspace_log_line(s, line, source="logcat"))
+        ws.log_thread.log_lines.connect(lambda lines, s=serial: self.on_workspace_log_lines(s, lines, source="logcat"))
         ws.log_thread.start()
 
         ws.focus_thread = FocusMonitorThread(serial)
@@ -1545,6 +1733,8 @@ class MainWindow(QMainWindow):
         if ws.focus_thread:
             ws.focus_thread.stop()
             ws.focus_thread = None
+        # The pollers are gone; release the device's persistent adb shell
+        AdbManager.close_shells(ws.serial)
         if ws.recorder:
             ws.recorder.record_event("live_stopped", {"serial": ws.serial})
             ws.recorder.finish_session("stopped")
@@ -1567,7 +1757,7 @@ class MainWindow(QMainWindow):
             return
         is_active = serial == self.active_workspace_serial
         if not is_active:
-            ws.last_frame_image = img.copy()
+            ws.last_frame_image = img
             ws.last_frame_size = (img.width(), img.height())
         if ws.recorder:
             tw = time.perf_counter()
@@ -1579,30 +1769,46 @@ class MainWindow(QMainWindow):
             ws.dump_bounds = self.dump_bounds
             ws.device_bounds = self.device_bounds
 
-    def on_workspace_tree(self, serial: str, xml_str: str, changed: bool) -> None:
+    def on_workspace_tree(self, serial: str, xml_str: str, changed: bool, parsed: Any = None) -> None:
         ws = self.workspaces.get(serial)
         if not ws:
             return
         ws.last_xml = xml_str
+        ws.last_tree = parsed
         if ws.recorder and changed:
             tw = time.perf_counter()
             ws.recorder.record_xml_dump(xml_str, reason="changed")
             self.perf.record("recorder_write", (time.perf_counter() - tw) * 1000.0)
         if serial == self.active_workspace_serial:
-            self.on_tree_data(xml_str, changed)
+            self.on_tree_data(xml_str, changed, parsed=parsed)
             ws.dump_bounds = self.dump_bounds
 
     def on_workspace_log_line(self, serial: str, line: str, source: str = "logcat") -> None:
+        self.on_workspace_log_lines(serial, [line], source=source)
+
+    def on_workspace_log_lines(self, serial: str, lines: List[str], source: str = "logcat") -> None:
         ws = self.workspaces.get(serial)
-        if not ws:
+        if not ws or not lines:
             return
-        ws.log_lines.append(line)
+        ws.log_lines.extend(lines)
         if len(ws.log_lines) > 8000:
-            ws.log_lines = ws.log_lines[-8000:]
+            del ws.log_lines[:-8000]
         if ws.recorder:
-            ws.recorder.record_log_line(line, source=source)
+            ws.recorder.record_log_lines(lines, source=source)
         if serial == self.active_workspace_serial:
-            self.txt_log.append(line)
+            self.log_buffer.extend(lines)
+
+    def flush_log_buffer(self) -> None:
+        if not self.log_buffer:
+            return
+        lines = list(self.log_buffer)
+        self.log_buffer.clear()
+        self.txt_log.appendPlainText("\n".join(lines))
+
+    def set_log_text(self, text: str) -> None:
+        # Pending lines belong to whatever the log showed before
+        self.log_buffer.clear()
+        self.txt_log.setPlainText(text)
 
     def _record_event_capture(
         self,
@@ -1639,6 +1845,10 @@ class MainWindow(QMainWindow):
             self.on_dump_error(msg)
 
     def on_frame(self, data):
+        if self.frame_paint_pending:
+            # Still presenting the previous frame; keep only the newest one
+            self.pending_frame = data
+            return
         tr = time.perf_counter()
         if isinstance(data, QImage):
             img = data
@@ -1646,7 +1856,8 @@ class MainWindow(QMainWindow):
             img = QImage.fromData(data)
         if img.isNull():
             return
-        self.last_frame_image = img.copy()
+        # QImage is implicitly shared; frames are never mutated in place, so no deep copy
+        self.last_frame_image = img
         orig_w = img.width()
         orig_h = img.height()
         if self.stream_max_size:
@@ -1663,23 +1874,42 @@ class MainWindow(QMainWindow):
             self.stream_scale = 1.0
         prev_size = self.last_frame_size
         self.last_frame_size = (img.width(), img.height())
+        pixmap = QPixmap.fromImage(img, Qt.NoFormatConversion)
+        if self.snapshot_png:
+            # Live frames replace a reduced-size snapshot decode
+            self.snapshot_png = None
+            if self.pixmap_item:
+                self.pixmap_item.resetTransform()
+                # A new frame every tick would invalidate any item cache
+                self.pixmap_item.setCacheMode(QGraphicsItem.NoCache)
         if not self.pixmap_item:
-            self.pixmap_item = self.scene.addPixmap(QPixmap.fromImage(img))
+            self.pixmap_item = self.scene.addPixmap(pixmap)
             self.pixmap_item.setZValue(0)
             self.handle_resize()
         else:
-            self.pixmap_item.setPixmap(QPixmap.fromImage(img))
+            self.pixmap_item.setPixmap(pixmap)
+        self.frame_paint_pending = True
+        QTimer.singleShot(0, self.on_frame_presented)
         if prev_size != self.last_frame_size:
+            self.scene.setSceneRect(self.pixmap_item.sceneBoundingRect())
             self.log_sys(f"Live frame: {img.width()}x{img.height()} (dump bounds: {self.dump_bounds})")
         self.fps_counter += 1
         ws = self._active_workspace()
         if ws:
-            ws.last_frame_image = self.last_frame_image.copy() if self.last_frame_image else None
+            ws.last_frame_image = self.last_frame_image
             ws.last_frame_size = self.last_frame_size
             ws.stream_scale = self.stream_scale
             ws.dump_bounds = self.dump_bounds
         self.perf.record("frame_render", (time.perf_counter() - tr) * 1000.0)
 
+    def on_frame_presented(self) -> None:
+        # Runs once the event loop is back; frames that queued up meanwhile collapse to the latest
+        self.frame_paint_pending = False
+        data = self.pending_frame
+        self.pending_frame = None
+        if data is not None:
+            self.on_frame(data)
+
     def update_fps(self):
         self.lbl_fps.setText(f"FPS: {self.fps_counter}")
         self.lbl_perf.setText(f"Perf: {self.perf.summary()}")
@@ -1836,11 +2066,13 @@ class MainWindow(QMainWindow):
         else:
             self.log_sys("SurfaceFlinger layers: no secure layers detected")
 
-    def on_tree_data(self, xml_str, changed):
+    def on_tree_data(self, xml_str, changed, source_path: Optional[str] = None, parsed: Any = None):
         if not changed and self.root_node: return
+        # Identical dump already on screen: skip reparse + tree rebuild
+        if self.root_node and xml_str == self.rendered_xml: return
 
         if self.perf_mode and self.video_thread:
-            now = time.time()
+            now = time.monotonic()
             if now - self.last_tree_update < 1.5:
                 return
             self.last_tree_update = now
@@ -1849,20 +2081,27 @@ class MainWindow(QMainWindow):
         if ws:
             ws.last_xml = xml_str
 
-        tp = time.perf_counter()
-        root, parse_err = UixParser.parse(xml_str)
-        self.perf.record("xml_parse", (time.perf_counter() - tp) * 1000.0)
+        if parsed is not None:
+            # Already parsed on the hierarchy thread
+            root, parse_err = parsed
+        else:
+            tp = time.perf_counter()
+            root, parse_err = self.parse_tree(xml_str, source_path)
+            self.perf.record("xml_parse", (time.perf_counter() - tp) * 1000.0)
+        if ws:
+            ws.last_tree = (root, parse_err)
         self.root_node = root
+        self.rendered_xml = xml_str if root else None
         if root and root.valid_bounds:
             self.dump_bounds = root.rect
         else:
             self.dump_bounds = None
         
-        self.tree.clear(); self.current_node_map = {}; self.node_to_item_map = {}; self.rect_map = []
+        self.populate_tree(root)
         if root:
-            self.populate_tree(root, self.tree)
             self.rect_map_sorted = sort_rects_by_area(self.rect_map)
-            node_count = self.count_nodes(root)
+            self.rect_grid = build_hit_grid(self.rect_map_sorted, extent=self.dump_bounds)
+            node_count = self.tree_model.node_count()
             self.log_sys(f"UI tree updated: {node_count} nodes")
             if parse_err:
                 self.log_sys("UI dump loaded but has zero valid bounds. The dump may be incomplete.")
@@ -1877,6 +2116,7 @@ class MainWindow(QMainWindow):
             self.rect_item.hide()
             self.set_tree_status("Unavailable", "#e06b6b")
             self.rect_map_sorted = []
+            self.rect_grid = None
 
         if root and not self.rect_map:
             self.log_sys("Snapshot flagged: zero valid element bounds detected.")
@@ -1885,38 +2125,64 @@ class MainWindow(QMainWindow):
         
         # Restore selection logic would go here
         
-    def populate_tree(self, node, parent):
-        name = f"{node.class_name.split('.')[-1]}"
-        if node.resource_id: name += f" ({node.resource_id.split('/')[-1]})"
-        elif node.text: name += f" \"{node.text}\""
-        
-        item = QTreeWidgetItem(parent); item.setText(0, name)
-        self.current_node_map[id(item)] = node; self.node_to_item_map[id(node)] = item
-        
-        if node.valid_bounds: self.rect_map.append((node.rect, node))
-        for c in node.children: self.populate_tree(c, item)
+    def parse_tree(self, xml_str: str, source_path: Optional[str] = None):
+        # Dumps read from disk are cached by path, mtime and size; live dumps always parse
+        if source_path:
+            cached = snapshot_cache.load_tree(source_path)
+            if cached:
+                return cached
+        root, parse_err = UixParser.parse(xml_str)
+        if source_path and root:
+            snapshot_cache.store_tree(source_path, root, parse_err)
+        return root, parse_err
+
+    def populate_tree(self, root) -> None:
+        # The view pulls rows from the model on demand; no per-node widget items
+        self.tree_model.set_root(root)
+        self.show_tree_model(self.tree_model)
+        # Keyed by id(); only valid for nodes of the tree being shown
+        self.locator_cache_by_node = {}
+        rect_map = []
+        if root:
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                if node.valid_bounds: rect_map.append((node.rect, node))
+                stack.extend(reversed(node.children))
+        self.rect_map = rect_map
+
+    def show_tree_model(self, model) -> None:
+        if self.tree.model() is model:
+            return
+        self.tree.setModel(model)
+        # setModel replaces the selection model, so its signal is rewired each time
+        self.tree.selectionModel().currentChanged.connect(self.on_tree_current_changed)
+
+    def node_for_tree_index(self, index):
+        if index.isValid() and index.model() is self.tree_model:
+            return self.tree_model.node(index)
+        return None
 
     def set_tree_placeholder(self, title: str, detail: str = "") -> None:
-        self.tree.clear()
-        self.current_node_map = {}
-        self.node_to_item_map = {}
+        self.tree_model.set_root(None)
+        self.locator_cache_by_node = {}
         self.rect_map = []
         self.rect_map_sorted = []
-        root_item = QTreeWidgetItem(self.tree)
-        root_item.setText(0, title)
+        self.rect_grid = None
+        self.rendered_xml = None
+        model = self.tree_placeholder_model
+        model.clear()
+        model.setHorizontalHeaderLabels(["UI Tree"])
+        root_item = QStandardItem(title)
+        root_item.setEditable(False)
         if detail:
-            detail_item = QTreeWidgetItem(root_item)
-            detail_item.setText(0, detail)
+            detail_item = QStandardItem(detail)
+            detail_item.setEditable(False)
+            root_item.appendRow(detail_item)
+        model.appendRow(root_item)
+        self.show_tree_model(model)
         self.tree.expandAll()
 
-    def count_nodes(self, node) -> int:
-        if not node:
-            return 0
-        total = 1
-        for child in node.children:
-            total += self.count_nodes(child)
-        return total
-
     def scene_to_dump_coords(self, x: int, y: int) -> tuple[int, int]:
         sx, sy, ox, oy = self.get_bounds_transform()
         if sx <= 0 or sy <= 0:
@@ -1927,23 +2193,45 @@ class MainWindow(QMainWindow):
         if not self.rect_map:
             return None
         dx, dy = self.scene_to_dump_coords(x, y)
-        rect_source = self.rect_map_sorted if self.rect_map_sorted else self.rect_map
-        return smallest_hit(rect_source, dx, dy)
+        if self.rect_grid is not None:
+            return self.rect_grid.hit(dx, dy)
+        if self.rect_map_sorted:
+            # Ascending by area: the first containing rect is the smallest one.
+            return first_hit(self.rect_map_sorted, dx, dy)
+        return smallest_hit(self.rect_map, dx, dy)
 
     def on_mouse_hover(self, x, y):
         self.lbl_coords.setText(f"X: {x}, Y: {y}")
-        now = time.monotonic()
-        if (now - self.last_hover_ts) < 0.012:
-            return
-        self.last_hover_ts = now
         best_node = self.find_best_node_at_scene(x, y)
         if best_node:
             self.view.setCursor(Qt.PointingHandCursor if best_node.clickable else Qt.ArrowCursor)
             if self.auto_follow_hover and not self.locked_node:
-                self.select_node(best_node, scroll=True)
+                self.schedule_hover_select(best_node)
         else:
             self.view.setCursor(Qt.ArrowCursor)
 
+    def schedule_hover_select(self, node) -> None:
+        # Coalesce rapid hover so only the node under the cursor when the timer fires is detailed
+        if node is self.selector_node and not self.hover_select_pending:
+            return
+        self.hover_pending_node = node
+        if not self.hover_select_pending:
+            self.hover_select_pending = True
+            QTimer.singleShot(30, self.flush_hover_select)
+
+    def flush_hover_select(self) -> None:
+        self.hover_select_pending = False
+        node = self.hover_pending_node
+        self.hover_pending_node = None
+        if node is None or node is self.selector_node:
+            return
+        # The hierarchy may have been rebuilt while the timer was pending
+        if not self.tree_model.contains(node):
+            return
+        if not self.auto_follow_hover or self.locked_node:
+            return
+        self.select_node(node, scroll=True)
+
     def handle_tap(self, x, y):
         # Always log the tap coordinate to help users who need manual test coordinates (System UI workaround)
         if self.video_thread:
@@ -1999,49 +2287,70 @@ class MainWindow(QMainWindow):
             ("Selected", str(node.selected)), ("Bounds", node.bounds_str)
         ]
         
-        self.tbl_props.setRowCount(0)
-        for i, (k,v) in enumerate(data):
-            self.tbl_props.insertRow(i)
-            self.tbl_props.setItem(i, 0, QTableWidgetItem(k))
-            self.tbl_props.setItem(i, 1, QTableWidgetItem(v))
+        self.set_table_rows(self.tbl_props, data)
         
         self.generate_selectors(node)
         
         if scroll:
-            item = self.node_to_item_map.get(id(node))
-            if item:
-                self.expand_to_item(item)
-                self.tree.blockSignals(True)
-                self.tree.setCurrentItem(item)
-                self.tree.scrollToItem(item)
-                self.tree.blockSignals(False)
+            index = self.tree_model.index_for_node(node)
+            if index.isValid() and self.tree.model() is self.tree_model:
+                self.expand_to_index(index)
+                # The selection model emits currentChanged itself; guard instead of blocking view signals
+                self.tree_selection_syncing = True
+                try:
+                    self.tree.setCurrentIndex(index)
+                finally:
+                    self.tree_selection_syncing = False
+                self.tree.scrollTo(index)
+
+    def set_table_rows(self, table: QTableWidget, rows: List[tuple]) -> None:
+        # Size once and reuse existing cells; a single repaint after the batch
+        table.setUpdatesEnabled(False)
+        try:
+            if table.rowCount() != len(rows):
+                table.setRowCount(len(rows))
+            for r, values in enumerate(rows):
+                for c, value in enumerate(values):
+                    cell = table.item(r, c)
+                    if cell is None:
+                        table.setItem(r, c, QTableWidgetItem(value))
+                    elif cell.text() != value:
+                        cell.setText(value)
+        finally:
+            table.setUpdatesEnabled(True)
 
     def generate_selectors(self, node):
-        self.current_suggestions = LocatorSuggester.generate_locators(node, self.root_node)
+        # Hover re-selects the same node constantly; suggestions only change with the node
+        if node is not self.selector_node:
+            self.selector_node = node
+            # Per-node memo for the current tree: revisiting a node is a dict lookup
+            entry = self.locator_cache_by_node.get(id(node))
+            if entry is None:
+                entry = (LocatorSuggester.generate_locators(node, self.root_node), {})
+                self.locator_cache_by_node[id(node)] = entry
+            self.current_suggestions, self.locator_text_cache = entry
         self.update_locators_text()
 
     def update_locators_text(self):
         if not hasattr(self, 'current_suggestions'): return
         fmt = self.combo_fmt.currentText()
-        out = ""
-        
-        for s in self.current_suggestions:
-            xpath = s['xpath']
-            # Formatting logic for Leandro's Python/Appium requirement
-            if "Python" in fmt:
-                code = f'driver.find_element(AppiumBy.XPATH, "{xpath}")'
-            elif "Java" in fmt:
-                code = f'driver.findElement(By.xpath("{xpath}"));'
-            else:
-                code = xpath
-                
-            prefix = "PRIMARY" if s['type'].startswith("Scoped") else "ALT"
-            out += f"[{prefix}] {s['type']}\n{code}\n\n"
-            
-        self.txt_loc.setText(out)
+        out = self.locator_text_cache.get(fmt)
+        if out is None:
+            out = self.locator_text_cache[fmt] = self.format_locators(self.current_suggestions, fmt)
+        if out != self.locator_text_shown:
+            self.locator_text_shown = out
+            self.txt_loc.setPlainText(out)
+
+    def format_locators(self, suggestions, fmt: str) -> str:
+        # Formatting logic for Leandro's Python/Appium requirement; resolved once per call
+        template = LOCATOR_FORMATS.get(fmt, "{}").format
+        return "".join(
+            f"[{'PRIMARY' if s['type'].startswith('Scoped') else 'ALT'}] {s['type']}\n{template(s['xpath'])}\n\n"
+            for s in suggestions
+        )
 
-    def on_tree_click(self, item, col):
-        node = self.current_node_map.get(id(item))
+    def on_tree_click(self, index):
+        node = self.node_for_tree_index(index)
         if node:
             self.toggle_lock(node)
             self.select_node(node, scroll=False)
@@ -2096,45 +2405,49 @@ class MainWindow(QMainWindow):
     def load_snapshot(self, path):
         # Stop live mode if active
         if self.video_thread: self.toggle_live()
+        # A newer load supersedes any screenshot decode still in flight
+        self.cancel_snapshot_decode()
+
+        # One directory listing instead of an exists() probe per artifact
+        try:
+            with os.scandir(path) as it:
+                entries = {e.name: e.path for e in it if e.is_file()}
+        except OSError:
+            entries = {}
         
         # Load Screenshot
-        png = os.path.join(path, "screenshot.png")
-        if os.path.exists(png):
-            if self.pixmap_item:
-                self.scene.removeItem(self.pixmap_item)
-                self.pixmap_item = None
-
-            if self.rect_item.scene() is None:
-                self.rect_item = QGraphicsRectItem()
-                self.rect_item.setPen(QPen(QColor(Theme.BMW_BLUE), 3))
-                self.rect_item.setZValue(99)
-                self.scene.addItem(self.rect_item)
-                self.rect_item.hide()
-
-            self.pixmap_item = self.scene.addPixmap(QPixmap(png))
-            self.handle_resize()
+        png = entries.get("screenshot.png")
+        if png:
+            # Swap the pixmap in place; the overlay item stays in the scene
+            self.rect_item.hide()
+            self.pending_frame = None
+            self.snapshot_png = png
+            # Header read only; the pixels are decoded on the thread pool
+            self.snapshot_source_size = QImageReader(png).size()
+            self.decode_snapshot_pixmap()
             self.stream_scale = 1.0
-            px = self.pixmap_item.pixmap()
-            if not px.isNull():
-                self.last_frame_size = (px.width(), px.height())
+            src = self.snapshot_source_size
+            if src.isValid() and not src.isEmpty():
+                self.scene.setSceneRect(QRectF(0, 0, src.width(), src.height()))
+                self.last_frame_size = (src.width(), src.height())
             else:
                 self.last_frame_size = None
             
         # Load XML
-        xml = os.path.join(path, "dump.uix")
-        if os.path.exists(xml):
+        xml = entries.get("dump.uix")
+        if xml:
             with open(xml, 'r', encoding='utf-8') as f:
-                self.on_tree_data(f.read(), True)
+                self.on_tree_data(f.read(), True, xml)
         else:
             self.log_sys("No dump.uix found in snapshot folder.")
 
         # Load logcat (offline)
-        logcat_path = os.path.join(path, "logcat.txt")
-        if os.path.exists(logcat_path):
+        logcat_path = entries.get("logcat.txt")
+        if logcat_path:
             with open(logcat_path, "r", encoding="utf-8", errors="replace") as f:
-                self.txt_log.setText(f.read())
+                self.set_log_text(f.read())
         else:
-            self.txt_log.setText("No logcat file found in this snapshot.")
+            self.set_log_text("No logcat file found in this snapshot.")
 
         self.log_sys(f"Loaded snapshot: {path}")
         self.last_snapshot_path = path
@@ -2314,17 +2627,21 @@ class MainWindow(QMainWindow):
         if not hasattr(self, "combo_timeline_session"):
             return
         root = self.settings.session_root_path()
-        sessions = []
-        for path in root.iterdir():
-            if path.is_dir() and (path / "session.db").exists():
-                sessions.append(path)
-        sessions.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        # scandir: dir type comes from the listing, one stat per session for the sort key
+        found = []
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "session.db")):
+                    found.append((entry.stat().st_mtime, Path(entry.path)))
+        found.sort(key=lambda item: item[0], reverse=True)
+        sessions = [path for _, path in found]
 
         self.combo_timeline_session.blockSignals(True)
         self.combo_timeline_session.clear()
         if hasattr(self, "list_sessions"):
             self.list_sessions.blockSignals(True)
             self.list_sessions.clear()
+        labels = []
         for session_dir in sessions:
             label = session_dir.name
             meta_path = session_dir / "meta.json"
@@ -2335,10 +2652,10 @@ class MainWindow(QMainWindow):
                 except Exception:
                     pass
             self.combo_timeline_session.addItem(label, str(session_dir))
-            if hasattr(self, "list_sessions"):
-                self.list_sessions.addItem(label)
+            labels.append(label)
         self.combo_timeline_session.blockSignals(False)
         if hasattr(self, "list_sessions"):
+            self.list_sessions.addItems(labels)
             if sessions:
                 self.list_sessions.setCurrentRow(0)
             self.list_sessions.blockSignals(False)
@@ -2392,18 +2709,21 @@ class MainWindow(QMainWindow):
 
         self.timeline_event_file_paths = {}
         self.timeline_event_payloads = {}
-        self.tbl_timeline.setRowCount(0)
+        table_rows = []
         for idx, (ts, kind, file_relpath, payload_json) in enumerate(rows):
-            self.tbl_timeline.insertRow(idx)
             ts_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(float(ts)))
-            self.tbl_timeline.setItem(idx, 0, QTableWidgetItem(ts_text))
-            self.tbl_timeline.setItem(idx, 1, QTableWidgetItem(str(kind)))
-            self.tbl_timeline.setItem(idx, 2, QTableWidgetItem(str(file_relpath or "")))
             preview = str(payload_json or "")[:180]
-            self.tbl_timeline.setItem(idx, 3, QTableWidgetItem(preview))
+            table_rows.append((ts_text, str(kind), str(file_relpath or ""), preview))
             self.timeline_event_payloads[idx] = str(payload_json or "")
             if file_relpath:
                 self.timeline_event_file_paths[idx] = str((session_dir / str(file_relpath)).resolve())
+        # One resize and one repaint for the whole event list instead of an insertRow per event
+        self.tbl_timeline.blockSignals(True)
+        try:
+            self.tbl_timeline.clearSelection()
+            self.set_table_rows(self.tbl_timeline, table_rows)
+        finally:
+            self.tbl_timeline.blockSignals(False)
         self.txt_timeline_detail.setText(f"Loaded {len(rows)} events from {session_dir}")
 
     def on_timeline_selection_changed(self) -> None:
@@ -2500,6 +2820,19 @@ class MainWindow(QMainWindow):
         self.auto_follow_hover = self.chk_auto_follow.isChecked()
         self.log_sys(f"Auto locate hover: {'on' if self.auto_follow_hover else 'off'}")
 
+    def toggle_opengl_viewport(self) -> None:
+        requested = self.chk_opengl.isChecked()
+        active = self.view.set_opengl_enabled(requested)
+        if requested and not active:
+            self.chk_opengl.blockSignals(True)
+            self.chk_opengl.setChecked(False)
+            self.chk_opengl.blockSignals(False)
+            self.log_sys("GPU viewport unavailable (QtOpenGLWidgets missing); using raster viewport")
+        self.settings.opengl_viewport = active
+        self.settings.save()
+        self.handle_resize()
+        self.log_sys(f"GPU viewport: {'on' if active else 'off'}")
+
     def toggle_ambient_video(self) -> None:
         self.ambient_enabled = self.chk_ambient.isChecked()
         if not self.ambient_enabled:
@@ -2542,7 +2875,11 @@ class MainWindow(QMainWindow):
 
     def apply_chrome_overlay(self, translucent: bool) -> None:
         overlay = "background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 rgba(12, 18, 34, 255), stop:1 rgba(18, 28, 60, 255));"
-        QApplication.instance().setStyleSheet(Theme.get_stylesheet(ambient_overlay=overlay, use_translucent=translucent))
+        sheet = Theme.get_stylesheet(ambient_overlay=overlay, use_translucent=translucent)
+        app = QApplication.instance()
+        # setStyleSheet repolishes every widget even for an identical sheet; the ambient timer re-applies it each tick
+        if app.styleSheet() != sheet:
+            app.setStyleSheet(sheet)
 
     def apply_led_fallback(self) -> None:
         return
@@ -2583,10 +2920,10 @@ class MainWindow(QMainWindow):
         self.ambient_prev_image = blended
         return blended
 
-    def expand_to_item(self, item: QTreeWidgetItem) -> None:
-        cur = item
-        while cur:
-            cur.setExpanded(True)
+    def expand_to_index(self, index) -> None:
+        cur = index.parent()
+        while cur.isValid():
+            self.tree.expand(cur)
             cur = cur.parent()
 
     def find_node_at(self, x: int, y: int):
@@ -2618,13 +2955,13 @@ class MainWindow(QMainWindow):
     def set_lock(self, node) -> None:
         self.locked_node = True
         self.locked_node_id = id(node)
-        self.rect_item.setPen(QPen(QColor(Theme.ACCENT_YELLOW), 3))
+        self.rect_item.setPen(self.locked_overlay_pen)
         self.log_sys("Selection locked")
 
     def clear_lock(self) -> None:
         self.locked_node = False
         self.locked_node_id = None
-        self.rect_item.setPen(QPen(QColor(Theme.BMW_BLUE), 3))
+        self.rect_item.setPen(self.overlay_pen)
         self.log_sys("Selection unlocked")
 
     def toggle_lock(self, node) -> None:
@@ -2634,11 +2971,11 @@ class MainWindow(QMainWindow):
             self.set_lock(node)
 
     def on_tree_current_changed(self, current, previous) -> None:
-        if not current:
+        if self.tree_selection_syncing or not current.isValid():
             return
         if self.locked_node:
             return
-        node = self.current_node_map.get(id(current))
+        node = self.node_for_tree_index(current)
         if node:
             self.select_node(node, scroll=False)
 
@@ -2702,9 +3039,9 @@ class MainWindow(QMainWindow):
 
     def keyPressEvent(self, event):
         if event.key() in (Qt.Key_Return, Qt.Key_Enter):
-            item = self.tree.currentItem()
-            if item:
-                node = self.current_node_map.get(id(item))
+            index = self.tree.currentIndex()
+            if index.isValid():
+                node = self.node_for_tree_index(index)
                 if node:
                     self.toggle_lock(node)
                     self.select_node(node, scroll=False)
@@ -2741,10 +3078,72 @@ class MainWindow(QMainWindow):
         self.log_sys(f"Performance mode: {'on' if self.perf_mode else 'off'}")
 
     def enable_fit(self): self.auto_fit = True; self.handle_resize()
-    def disable_fit(self): self.auto_fit = False; self.view.resetTransform()
+    def disable_fit(self): self.auto_fit = False; self.handle_resize(); self.view.resetTransform()
     def handle_resize(self):
+        if self.snapshot_png and self.pixmap_item:
+            target = self.snapshot_target_size()
+            shown = self.snapshot_decode_size
+            # Re-decode only on a significant size change, not on every resize tick
+            if abs(target.width() - shown.width()) > max(64, shown.width() // 4):
+                self.decode_snapshot_pixmap()
         if self.auto_fit and self.pixmap_item: self.view.fitInView(self.pixmap_item, Qt.KeepAspectRatio)
 
+    def snapshot_target_size(self) -> QSize:
+        src = self.snapshot_source_size
+        if not self.auto_fit or not src.isValid() or src.isEmpty():
+            return src
+        vp = self.view.viewport().size() * self.view.devicePixelRatioF()
+        if vp.isEmpty() or (src.width() <= vp.width() and src.height() <= vp.height()):
+            return src
+        return src.scaled(vp, Qt.KeepAspectRatio)
+
+    def decode_snapshot_pixmap(self) -> None:
+        # Decode on the thread pool and let the image reader scale while decoding instead of
+        # inflating the full-resolution PNG; only the newest request is applied
+        src = self.snapshot_source_size
+        target = self.snapshot_target_size()
+        self.snapshot_decode_size = target
+        self.cancel_snapshot_decode()
+        scaled = target if target.isValid() and target != src else QSize()
+        # Switching back to a snapshot (or size) shown earlier in the session skips the round trip
+        self.snapshot_pixmap_key = snapshot_cache.cache_key(self.snapshot_png, f"{scaled.width()}x{scaled.height()}")
+        cached = QPixmapCache.find(self.snapshot_pixmap_key) if self.snapshot_pixmap_key else None
+        if cached is not None and not cached.isNull():
+            self.show_snapshot_pixmap(cached)
+            return
+        QThreadPool.globalInstance().start(
+            SnapshotDecodeTask(self.snapshot_png, scaled, self.snapshot_decode_token, self.snapshot_decoder)
+        )
+
+    def cancel_snapshot_decode(self) -> None:
+        # Queued decodes for an older token skip their work; running ones are dropped on delivery
+        self.snapshot_decode_token += 1
+        self.snapshot_decoder.latest_token = self.snapshot_decode_token
+
+    def on_snapshot_decoded(self, token: int, img: QImage) -> None:
+        if token != self.snapshot_decode_token or not self.snapshot_png:
+            return
+        pixmap = QPixmap.fromImage(img)
+        if self.snapshot_pixmap_key and not pixmap.isNull():
+            QPixmapCache.insert(self.snapshot_pixmap_key, pixmap)
+        self.show_snapshot_pixmap(pixmap)
+
+    def show_snapshot_pixmap(self, pixmap: QPixmap) -> None:
+        src = self.snapshot_source_size
+        if self.pixmap_item:
+            self.pixmap_item.setPixmap(pixmap)
+        else:
+            self.pixmap_item = self.scene.addPixmap(pixmap)
+            self.pixmap_item.setZValue(0)
+        # Static screenshot: repaints under the crosshair/overlay become a cached blit
+        self.pixmap_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        if not pixmap.isNull() and src.isValid() and not src.isEmpty():
+            # The item is scaled back up so scene coordinates stay in screenshot pixels
+            self.pixmap_item.setTransform(QTransform.fromScale(src.width() / pixmap.width(), src.height() / pixmap.height()))
+        else:
+            self.pixmap_item.resetTransform()
+        if self.auto_fit: self.view.fitInView(self.pixmap_item, Qt.KeepAspectRatio)
+
     def on_ambient_frame(self, frame) -> None:
         if not self.ambient_enabled:
             return
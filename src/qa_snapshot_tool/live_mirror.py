@@ -8,18 +8,138 @@ Provides background threads for real-time device interaction:
 - Focus monitoring
 """
 
-from PySide6.QtCore import QThread, Signal, QObject
+from PySide6.QtCore import QThread, Signal, QObject, Qt
 from PySide6.QtGui import QImage
-import hashlib
 import os
+import sys
 import time
 import subprocess
 import threading
 import shutil
+from collections import deque
 import ctypes
 from ctypes import wintypes
-from typing import Optional, Protocol, runtime_checkable
-from qa_snapshot_tool.adb_manager import AdbManager
+from typing import List, Optional, Protocol, runtime_checkable
+from qa_snapshot_tool.adb_manager import AdbManager, RawCaptureSession
+from qa_snapshot_tool.uix_parser import UixParser
+
+class _ReplayableReader:
+    """
+    File-like wrapper over a pipe that can replay what was read so far.
+    Lets a failed decoder open (e.g. an unusable hardware device) be retried
+    on the same stream; recording stops once a decoder has been chosen.
+    Reads return whatever the pipe has buffered rather than waiting for a full
+    block, and report end of stream once keep_running() turns false.
+    """
+
+    def __init__(self, raw, keep_running=lambda: True):
+        self.raw = raw
+        self.keep_running = keep_running
+        self.recorded = bytearray()
+        self.pos = 0
+        self.recording = True
+
+    def read(self, size: int = -1) -> bytes:
+        if not self.keep_running():
+            return b""
+        if self.pos < len(self.recorded):
+            end = len(self.recorded) if size < 0 else self.pos + size
+            chunk = bytes(self.recorded[self.pos:end])
+            self.pos += len(chunk)
+            return chunk
+        if not self.recording and self.recorded:
+            self.recorded = bytearray()
+            self.pos = 0
+        read1 = getattr(self.raw, "read1", None)
+        data = read1(size) if read1 is not None and size > 0 else self.raw.read(size)
+        if self.recording:
+            self.recorded += data
+            self.pos += len(data)
+        return data
+
+    def rewind(self) -> None:
+        self.pos = 0
+
+    def release(self) -> None:
+        self.recording = False
+
+
+# scrcpy is a console program; don't let Windows allocate a console host for it
+_NO_CONSOLE = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Looked up once per process: stream restarts (device reconnects) reuse the answers
+# (av is imported on first use, not with this module, to keep it off the app's startup path)
+_UNSET = object()
+_scrcpy_bin_on_path = _UNSET
+_av_module = _UNSET
+
+
+def _which_scrcpy() -> Optional[str]:
+    global _scrcpy_bin_on_path
+    if _scrcpy_bin_on_path is _UNSET:
+        _scrcpy_bin_on_path = shutil.which("scrcpy")
+    return _scrcpy_bin_on_path
+
+
+def _load_av():
+    """The PyAV module, or None when it is not installed."""
+    global _av_module
+    if _av_module is _UNSET:
+        try:
+            import av  # type: ignore
+            _av_module = av
+        except Exception:
+            _av_module = None
+    return _av_module
+
+
+def _pyav_available() -> bool:
+    return _load_av() is not None
+
+
+def _read_line_batches(stream, keep_running=lambda: True):
+    """
+    Yields the complete, non-empty lines of a binary pipe, one list per read.
+    A pipe read returns whatever is buffered (up to 64 KB), so a burst of output
+    becomes one decode and one batch instead of one of each per line.
+    """
+    fd = stream.fileno()
+    pending = b""
+    while keep_running():
+        try:
+            chunk = os.read(fd, 65536)
+        except OSError:
+            break
+        if not chunk:
+            break
+        pending += chunk
+        cut = pending.rfind(b"\n")
+        if cut >= 0:
+            text = pending[:cut].decode("utf-8", errors="replace")
+            pending = pending[cut + 1:]
+            lines = [line for line in (raw.strip() for raw in text.split("\n")) if line]
+            if lines:
+                yield lines
+    # Unterminated last line at end of stream
+    last = pending.decode("utf-8", errors="replace").strip()
+    if last:
+        yield [last]
+
+
+def _hwaccel_candidates(av) -> list:
+    """Hardware decoders to try for H.264, in order, limited to what the loaded FFmpeg provides."""
+    try:
+        from av.codec.hwaccel import hwdevices_available
+        available = set(hwdevices_available())
+    except Exception:
+        return []
+    if sys.platform.startswith("win"):
+        preferred = ["d3d11va", "cuda"]
+    elif sys.platform == "darwin":
+        preferred = ["videotoolbox"]
+    else:
+        preferred = ["cuda", "vaapi"]
+    return [d for d in preferred if d in available]
 
 @runtime_checkable
 class VideoSourceInterface(Protocol):
@@ -34,32 +154,122 @@ class VideoThread(QThread):
     High FPS Screenshot Loop. 
     Continuously fetches screenshots to simulate a video feed.
     """
-    frame_ready = Signal(object) # Emits Raw PNG bytes
+    frame_ready = Signal(object) # Emits decoded QImage
+
+    # screencap raw pixel formats (android PixelFormat) accepted by AdbManager.parse_raw_screencap
+    RAW_FORMATS = {
+        1: QImage.Format_RGBA8888,
+        2: QImage.Format_RGBX8888,
+        5: QImage.Format_ARGB32, # BGRA in memory
+    }
+    max_frames_in_flight = 2
+    rate_raise_interval_s = 5.0
     
     def __init__(self, serial: str, target_fps: int = 6):
         super().__init__()
         self.serial = serial
         self.running = True
         self.target_fps = max(1, int(target_fps))
+        # Rate actually paced at: drops below target_fps while captures overrun their budget
+        self.effective_fps = self.target_fps
+        self._last_rate_raise = 0.0
+        self.last_data = b""
+        self.capture_session: Optional[RawCaptureSession] = None
+        self.session_failures = 0
+        # One entry per emitted frame not yet delivered to the GUI thread. This object lives
+        # in the GUI thread, so the slot below runs there (queued) once a frame has been handed over.
+        self.frames_in_flight = deque()
+        self.frame_ready.connect(self._on_frame_delivered)
+
+    def _on_frame_delivered(self, _img) -> None:
+        if self.frames_in_flight:
+            self.frames_in_flight.popleft()
+
+    def capture_raw(self):
+        # Persistent shell first: no adb process spawn per frame
+        if self.capture_session is None and self.running and self.session_failures < 3:
+            self.capture_session = AdbManager.open_capture_session(self.serial)
+        session = self.capture_session
+        if session is not None:
+            raw = session.capture()
+            if raw is not None:
+                return raw
+            session.close()
+            self.capture_session = None
+            self.session_failures += 1
+        return AdbManager.get_screenshot_raw(self.serial)
+
+    def capture(self):
+        """Returns (key for change detection, QImage factory) or (None, None)."""
+        raw = self.capture_raw()
+        if raw is not None:
+            w, h, fmt, pixels = raw
+            # Change detection compares the backing bytes/bytearray: == on those is a memcmp, while
+            # comparing memoryviews walks them element by element (~25x slower per frame). The size
+            # and format go along since a session buffer carries no header.
+            # Wraps the pixel buffer directly: no PNG encode on device, no decode here
+            return (w, h, fmt, pixels.obj), lambda: QImage(pixels, w, h, w * 4, self.RAW_FORMATS[fmt])
+        data = AdbManager.get_screenshot_bytes(self.serial)
+        if not data:
+            return None, None
+        return data, lambda: QImage.fromData(data)
+
+    def adapt_rate(self, fetch_s: float, now: float) -> None:
+        """Additive decrease while a capture takes over 1.5x its frame budget, one step back up per interval."""
+        if fetch_s > 1.5 / self.effective_fps:
+            self.effective_fps = max(1, self.effective_fps - 1)
+            self._last_rate_raise = now
+        elif self.effective_fps < self.target_fps and now - self._last_rate_raise >= self.rate_raise_interval_s:
+            self.effective_fps += 1
+            self._last_rate_raise = now
 
     def run(self) -> None:
+        next_t = time.monotonic()
         while self.running:
-            start = time.time()
-            # Fetch bytes directly
-            data = AdbManager.get_screenshot_bytes(self.serial)
-            if data:
-                self.frame_ready.emit(data)
+            fetch_start = time.monotonic()
+            data, decode = self.capture()
+            now = time.monotonic()
+            # Screencap over USB is bandwidth-bound: back off instead of polling back to back
+            self.adapt_rate(now - fetch_start, now)
+            if data is not None and data == self.last_data:
+                # Static screen: identical frame bytes, so skip the decode and the GUI repaint
+                pass
             else:
-                time.sleep(0.5) # Error backoff
+                # Decode here so the GUI thread only receives a ready QImage
+                # (Signal(object) hands over the reference without copying pixels).
+                img = decode() if decode else None
+                if img is not None and not img.isNull():
+                    # Drop the frame while the GUI is behind instead of queuing images without bound;
+                    # last_data stays unset so the next capture is offered again even if identical
+                    if len(self.frames_in_flight) < self.max_frames_in_flight:
+                        self.last_data = data
+                        self.frames_in_flight.append(None)
+                        self.frame_ready.emit(img)
+                else:
+                    self.msleep(500) # Error backoff
+                    next_t = time.monotonic()
+                    continue
 
-            # Throttle capture rate for stability
-            elapsed = time.time() - start
-            frame_budget = 1.0 / max(1, self.target_fps)
-            if elapsed < frame_budget:
-                time.sleep(frame_budget - elapsed)
+            # Pace against a monotonic deadline: sleep only what is left of the frame budget,
+            # and restart the schedule when a slow capture overran it instead of bursting to catch up.
+            # time.sleep, not msleep: on Windows it waits on a high-resolution timer (Python 3.11+)
+            # where Sleep() rounds up to the ~15.6 ms system tick
+            next_t += 1.0 / self.effective_fps
+            delay = next_t - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_t = time.monotonic()
+        if self.capture_session is not None:
+            self.capture_session.close()
+            self.capture_session = None
 
     def stop(self) -> None:
         self.running = False
+        session, self.capture_session = self.capture_session, None
+        if session is not None:
+            # Killing the shell also unblocks a frame read in progress
+            session.close()
         if not self.wait(1200):
             self.terminate()
             self.wait(800)
@@ -72,6 +282,7 @@ class VideoThread(QThread):
 
     def set_target_fps(self, fps: int) -> None:
         self.target_fps = max(1, int(fps))
+        self.effective_fps = self.target_fps
 
 class ScrcpyVideoSource(QObject):
     """
@@ -80,6 +291,11 @@ class ScrcpyVideoSource(QObject):
     """
     frame_ready = Signal(object)  # Emits QImage or bytes when falling back
     log_line = Signal(str)
+    log_lines = Signal(list) # scrcpy's own output, one list per pipe read
+    _release_pending = Signal()
+    # Preview stream only: baseline profile (no B-frames) and a 1 s GOP keep decode latency low
+    RAW_CODEC_OPTIONS = "profile=1,i-frame-interval=1"
+    RAW_MAX_BITRATE = 2_000_000
 
     def __init__(
         self,
@@ -113,8 +329,18 @@ class ScrcpyVideoSource(QObject):
         self._moved_offscreen = False
         self._scrcpy_bin: Optional[str] = None
         self._last_frame_ts: float = 0.0
+        # GDI capture objects reused across frames: (hwnd, width, height, hwnd_dc, mem_dc, bmp, bmi)
+        self._dib_cache: Optional[tuple] = None
         self._raw_requested = False
         self._raw_failed = False
+        # At most one decoded frame queued to the GUI thread; newer frames replace the one
+        # waiting behind it, so a slow GUI sees the latest picture instead of a growing backlog
+        self._frame_lock = threading.Lock()
+        self._frame_in_flight = False
+        self._pending_frame: Optional[QImage] = None
+        self.frame_ready.connect(self._on_frame_delivered)
+        # Queued even on the GUI thread: posted behind the paint events already waiting
+        self._release_pending.connect(self._emit_pending_frame, Qt.QueuedConnection)
 
     def start_stream(self) -> None:
         if self._running:
@@ -122,31 +348,51 @@ class ScrcpyVideoSource(QObject):
         self._running = True
         self._start_scrcpy_stream()
 
+    def _offer_frame(self, img: QImage) -> None:
+        """Called from the capture/decode thread for every new frame."""
+        with self._frame_lock:
+            if self._frame_in_flight:
+                self._pending_frame = img
+                return
+            self._frame_in_flight = True
+        self.frame_ready.emit(img)
+
+    def _on_frame_delivered(self, _img) -> None:
+        # Runs on the GUI thread once a frame has been handed over. Receivers of that same
+        # frame may not have run yet (each queued slot is its own event), so the newest frame
+        # that arrived meanwhile (a static stream may not produce another) is released
+        # through the event queue rather than emitted from here, where it would overtake them
+        with self._frame_lock:
+            if self._pending_frame is None:
+                self._frame_in_flight = False
+                return
+        self._release_pending.emit()
+
+    def _emit_pending_frame(self) -> None:
+        with self._frame_lock:
+            img, self._pending_frame = self._pending_frame, None
+            self._frame_in_flight = img is not None
+        if img is not None:
+            self.frame_ready.emit(img)
+
     def _start_scrcpy_stream(self) -> None:
         if not self._running:
             return
-        scrcpy_bin = self.scrcpy_path or shutil.which("scrcpy")
+        scrcpy_bin = self.scrcpy_path or _which_scrcpy()
         if not scrcpy_bin:
             self._start_adb_fallback()
             return
         self._scrcpy_bin = scrcpy_bin
-        if self.prefer_raw and self._pyav_available():
+        if self.prefer_raw and _pyav_available():
             self._raw_requested = True
             self._start_raw_stream(scrcpy_bin)
         else:
-            if self.prefer_raw and not self._pyav_available():
+            if self.prefer_raw and not _pyav_available():
                 self.log_line.emit("PyAV not installed; falling back to scrcpy window capture")
             if not self.prefer_raw:
                 self.log_line.emit("scrcpy raw video disabled by user; using window capture")
             self._start_window_capture(scrcpy_bin)
 
-    def _pyav_available(self) -> bool:
-        try:
-            import av  # type: ignore
-            return True
-        except Exception:
-            return False
-
     def _detect_raw_support(self, scrcpy_bin: str) -> bool:
         try:
             res = subprocess.run([scrcpy_bin, "--help"], capture_output=True, text=True)
@@ -155,7 +401,7 @@ class ScrcpyVideoSource(QObject):
         except Exception:
             return False
 
-    def _start_raw_stream(self, scrcpy_bin: str) -> None:
+    def _raw_stream_cmd(self, scrcpy_bin: str) -> list:
         cmd = [
             scrcpy_bin,
             "--serial",
@@ -164,6 +410,9 @@ class ScrcpyVideoSource(QObject):
             "--no-control",
             "--raw-video=-",
             "--no-audio",
+            "--video-codec=h264",
+            "--video-codec-options",
+            self.RAW_CODEC_OPTIONS,
         ]
         if self.display_id:
             cmd += ["--display-id", str(self.display_id)]
@@ -172,7 +421,12 @@ class ScrcpyVideoSource(QObject):
         if self.max_fps:
             cmd += ["--max-fps", str(int(self.max_fps))]
         if self.bitrate:
-            cmd += ["--video-bit-rate", str(int(self.bitrate))]
+            bitrate = min(int(self.bitrate), self.RAW_MAX_BITRATE)
+            cmd += ["--video-bit-rate", str(bitrate)]
+        return cmd
+
+    def _start_raw_stream(self, scrcpy_bin: str) -> None:
+        cmd = self._raw_stream_cmd(scrcpy_bin)
 
         try:
             env = os.environ.copy()
@@ -181,11 +435,14 @@ class ScrcpyVideoSource(QObject):
             msys_bin = "C:/msys64/mingw64/bin"
             if os.path.exists(msys_bin) and "scrcpy-3.3.4" in scrcpy_bin and "x" in scrcpy_bin:
                 env["PATH"] = f"{msys_bin};{env.get('PATH','')}"
+            # 1 MB stdout buffer: PyAV pulls the H.264 stream in few, large pipe reads
             self._proc = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 env=env,
+                bufsize=1 << 20,
+                creationflags=_NO_CONSOLE,
             )
         except Exception:
             self._start_adb_fallback()
@@ -194,7 +451,7 @@ class ScrcpyVideoSource(QObject):
         self.log_line.emit("scrcpy raw H.264 decode active (PyAV)")
         self._thread = threading.Thread(target=self._read_raw_stream, daemon=True)
         self._thread.start()
-        threading.Thread(target=self._read_stderr, daemon=True).start()
+        threading.Thread(target=self._read_log_output, args=(self._proc.stderr,), daemon=True).start()
 
     def _start_window_capture(self, scrcpy_bin: str) -> None:
         cmd = [
@@ -227,19 +484,20 @@ class ScrcpyVideoSource(QObject):
             msys_bin = "C:/msys64/mingw64/bin"
             if os.path.exists(msys_bin) and "scrcpy-3.3.4" in scrcpy_bin and "x" in scrcpy_bin:
                 env["PATH"] = f"{msys_bin};{env.get('PATH','')}"
+            # Both pipes only carry log text here: merge them so one thread drains them
             self._proc = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 env=env,
+                creationflags=_NO_CONSOLE,
             )
         except Exception:
             self._start_adb_fallback()
             return
 
         self.log_line.emit("scrcpy window capture active (PrintWindow)")
-        threading.Thread(target=self._read_stderr, daemon=True).start()
-        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._read_log_output, args=(self._proc.stdout,), daemon=True).start()
         self._thread = threading.Thread(target=self._capture_window_loop, daemon=True)
         self._thread.start()
 
@@ -247,30 +505,62 @@ class ScrcpyVideoSource(QObject):
         if not self._proc or not self._proc.stdout:
             self._start_adb_fallback()
             return
+        av = _load_av()
+        if av is None:
+            self.log_line.emit("PyAV not installed. Falling back to scrcpy window capture.")
+            self._restart_as_window_capture()
+            return
         try:
-            import av
-
-            container = av.open(self._proc.stdout, format="h264")
-            for frame in container.decode(video=0):
+            reader = _ReplayableReader(self._proc.stdout, lambda: self._running)
+            container = self._open_h264(av, reader)
+            reader.release()
+            stream = container.streams.video[0]
+            # Spread decoding over the host's cores (FFmpeg picks the thread count). LOW_DELAY rules
+            # out frame threading, which holds back thread_count - 1 decoded frames, so AUTO settles
+            # on slice threads and every frame comes out as soon as its packet is decoded
+            stream.codec_context.flags |= av.codec.context.Flags.low_delay
+            stream.thread_type = "AUTO"
+            stream.thread_count = 0
+            # One scaler for the whole stream: frame.reformat() would build a new SwsContext per frame
+            reformatter = av.video.reformatter.VideoReformatter()
+            for frame in container.decode(stream):
                 if not self._running:
                     break
-                img = frame.to_ndarray(format="bgr24")
-                h, w, ch = img.shape
-                bytes_per_line = ch * w
-                qimg = QImage(img.data, w, h, bytes_per_line, QImage.Format_BGR888)
+                qimg = self._frame_to_qimage(frame, reformatter)
                 try:
-                    self.frame_ready.emit(qimg.copy())
-                    self._last_frame_ts = time.time()
+                    self._offer_frame(qimg)
+                    self._last_frame_ts = time.monotonic()
                 except RuntimeError:
                     self._running = False
                     break
-        except ImportError:
-            self.log_line.emit("PyAV not installed. Falling back to scrcpy window capture.")
-            self._restart_as_window_capture()
         except Exception as ex:
             self.log_line.emit(f"scrcpy decode failed: {ex}")
             self._restart_as_window_capture()
 
+    @staticmethod
+    def _frame_to_qimage(frame, reformatter=None) -> QImage:
+        # One swscale pass to packed RGB, then wrap that plane in place: no numpy array,
+        # no extra copy. The QImage keeps the plane (and its frame) alive, honoring padded strides.
+        if reformatter is not None:
+            rgb = reformatter.reformat(frame, format="rgb24")
+        else:
+            rgb = frame.reformat(format="rgb24")
+        plane = rgb.planes[0]
+        return QImage(memoryview(plane), rgb.width, rgb.height, plane.line_size, QImage.Format_RGB888)
+
+    def _open_h264(self, av, reader: _ReplayableReader):
+        # Hardware decode first; the stream is replayed into the next candidate if a device cannot be opened
+        for device in _hwaccel_candidates(av):
+            try:
+                from av.codec.hwaccel import HWAccel
+
+                container = av.open(reader, format="h264", hwaccel=HWAccel(device_type=device, allow_software_fallback=True))
+                self.log_line.emit(f"scrcpy hardware decode active ({device})")
+                return container
+            except (av.FFmpegError, ValueError):
+                reader.rewind()
+        return av.open(reader, format="h264")
+
     def _restart_as_window_capture(self) -> None:
         if not self._scrcpy_bin:
             self._start_adb_fallback()
@@ -295,51 +585,154 @@ class ScrcpyVideoSource(QObject):
             return
         target_fps = max(1, int(self.max_fps)) if self.max_fps else 30
         frame_budget = 1.0 / target_fps
-        start_ts = time.time()
-        while self._running:
-            start = time.time()
-            img = self._capture_window_image(hwnd)
-            if img is not None and not img.isNull():
-                if self.hide_window and not self._moved_offscreen:
-                    self._move_window_offscreen(hwnd)
-                    self._moved_offscreen = True
-                try:
-                    self.frame_ready.emit(img)
-                    self._last_frame_ts = time.time()
-                except RuntimeError:
-                    self._running = False
-                    break
-            if self._last_frame_ts == 0.0 and (time.time() - start_ts) > 3.0:
-                self.log_line.emit("No frames received from scrcpy window; falling back to ADB capture")
-                self._start_adb_fallback()
-                return
-            elapsed = time.time() - start
-            if elapsed < frame_budget:
-                time.sleep(frame_budget - elapsed)
+        start_ts = time.monotonic()
+        next_t = time.monotonic()
+        last_img: Optional[QImage] = None
+        try:
+            while self._running:
+                img = self._capture_window_image(hwnd)
+                if img is not None and not img.isNull():
+                    if self.hide_window and not self._moved_offscreen:
+                        self._move_window_offscreen(hwnd)
+                        self._moved_offscreen = True
+                    if last_img is not None and img == last_img:
+                        # Static window: same pixels as the last frame sent, so skip the GUI repaint
+                        self._last_frame_ts = time.monotonic()
+                    else:
+                        try:
+                            self._offer_frame(img)
+                            self._last_frame_ts = time.monotonic()
+                            last_img = img
+                        except RuntimeError:
+                            self._running = False
+                            break
+                if self._last_frame_ts == 0.0 and (time.monotonic() - start_ts) > 3.0:
+                    self.log_line.emit("No frames received from scrcpy window; falling back to ADB capture")
+                    self._start_adb_fallback()
+                    return
+                # Same deadline pacing as VideoThread: no drift from per-frame sleep rounding
+                next_t += frame_budget
+                delay = next_t - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_t = time.monotonic()
+        finally:
+            # Released on the capture thread, the only one touching the GDI objects
+            self._release_dib_cache()
 
     def _find_window_handle(self, title: str, timeout: float = 5.0) -> int:
         try:
-            import ctypes
-
-            user32 = ctypes.windll.user32
-            end = time.time() + timeout
-            while time.time() < end and self._running:
-                hwnd = user32.FindWindowW(None, title)
-                if hwnd:
-                    return int(hwnd)
-                time.sleep(0.1)
+            hwnd = self._wait_for_window_event(title, timeout)
         except Exception:
-            pass
+            hwnd = None
+        if hwnd:
+            return hwnd
+        if hwnd is None:  # no hooks; poll by title
+            try:
+                user32 = ctypes.windll.user32
+                end = time.monotonic() + timeout
+                while time.monotonic() < end and self._running:
+                    hwnd = user32.FindWindowW(None, title)
+                    if hwnd:
+                        return int(hwnd)
+                    time.sleep(0.1)
+            except Exception:
+                pass
         if self._proc and self._proc.pid:
             return self._find_window_handle_by_pid(self._proc.pid, timeout=timeout)
         return 0
 
-    def _find_window_handle_by_pid(self, pid: int, timeout: float = 5.0) -> int:
+    def _wait_for_window_event(self, title: str, timeout: float) -> Optional[int]:
+        """Wait for scrcpy's window via WinEvent hooks instead of polling FindWindowW.
+
+        Returns None when the hooks cannot be installed so the caller can poll instead.
+        """
+        if not self._proc or not self._proc.pid:
+            return None
+        user32 = ctypes.windll.user32
+        EVENT_OBJECT_CREATE = 0x8000
+        EVENT_OBJECT_SHOW = 0x8002
+        EVENT_OBJECT_NAMECHANGE = 0x800C
+        WINEVENT_OUTOFCONTEXT = 0x0000
+        OBJID_WINDOW = 0
+        CHILDID_SELF = 0
+        GA_ROOT = 2
+        QS_ALLINPUT = 0x04FF
+        PM_REMOVE = 0x0001
+
+        WINEVENTPROC = ctypes.WINFUNCTYPE(
+            None,
+            wintypes.HANDLE,
+            wintypes.DWORD,
+            wintypes.HWND,
+            wintypes.LONG,
+            wintypes.LONG,
+            wintypes.DWORD,
+            wintypes.DWORD,
+        )
+        user32.SetWinEventHook.argtypes = [
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.HMODULE,
+            WINEVENTPROC,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.DWORD,
+        ]
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+        user32.GetAncestor.restype = wintypes.HWND
+        found: List[int] = []
+
+        def on_event(_hook, _event, hwnd, id_object, id_child, _thread, _ms):
+            if found or not hwnd or id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+                return
+            if user32.GetAncestor(hwnd, GA_ROOT) != hwnd:
+                return
+            buf = ctypes.create_unicode_buffer(256)
+            user32.GetWindowTextW(hwnd, buf, 256)
+            if buf.value == title:
+                found.append(int(hwnd))
+
+        callback = WINEVENTPROC(on_event)  # must outlive the hooks
+        pid = self._proc.pid
+        # Out-of-context hooks only see scrcpy's own events: window creation, first show, title set
+        hooks = [
+            h
+            for h in (
+                user32.SetWinEventHook(EVENT_OBJECT_CREATE, EVENT_OBJECT_SHOW, None, callback, pid, 0, WINEVENT_OUTOFCONTEXT),
+                user32.SetWinEventHook(EVENT_OBJECT_NAMECHANGE, EVENT_OBJECT_NAMECHANGE, None, callback, pid, 0, WINEVENT_OUTOFCONTEXT),
+            )
+            if h
+        ]
+        if not hooks:
+            return None
         try:
-            import ctypes
+            # The window may have appeared before the hooks were in place
+            hwnd = user32.FindWindowW(None, title)
+            if hwnd:
+                return int(hwnd)
+            msg = wintypes.MSG()
+            end = time.monotonic() + timeout
+            while not found and self._running:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    break
+                # Hook callbacks arrive as messages on this thread; wake at least every 250 ms to honour stop
+                user32.MsgWaitForMultipleObjects(0, None, False, int(min(remaining, 0.25) * 1000), QS_ALLINPUT)
+                while user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_REMOVE):
+                    user32.TranslateMessage(ctypes.byref(msg))
+                    user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            for hook in hooks:
+                user32.UnhookWinEvent(hook)
+        return found[0] if found else 0
 
+    def _find_window_handle_by_pid(self, pid: int, timeout: float = 5.0) -> int:
+        try:
             user32 = ctypes.windll.user32
-            end = time.time() + timeout
+            end = time.monotonic() + timeout
             hwnd_found = ctypes.c_void_p(0)
 
             @ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, wintypes.LPARAM)
@@ -353,7 +746,7 @@ class ScrcpyVideoSource(QObject):
                 hwnd_found.value = hwnd
                 return False
 
-            while time.time() < end and self._running:
+            while time.monotonic() < end and self._running:
                 hwnd_found.value = 0
                 user32.EnumWindows(enum_proc, 0)
                 if hwnd_found.value:
@@ -385,48 +778,64 @@ class ScrcpyVideoSource(QObject):
             if width <= 0 or height <= 0:
                 return None
 
-            hwnd_dc = user32.GetDC(hwnd)
-            mem_dc = gdi32.CreateCompatibleDC(hwnd_dc)
-            bmp = gdi32.CreateCompatibleBitmap(hwnd_dc, width, height)
-            gdi32.SelectObject(mem_dc, bmp)
+            cache = self._dib_cache
+            if cache is None or cache[:3] != (hwnd, width, height):
+                # First frame or the window was resized: rebuild the DCs and bitmap
+                self._release_dib_cache()
+                hwnd_dc = user32.GetDC(hwnd)
+                mem_dc = gdi32.CreateCompatibleDC(hwnd_dc)
+                bmp = gdi32.CreateCompatibleBitmap(hwnd_dc, width, height)
+                gdi32.SelectObject(mem_dc, bmp)
+
+                bmi = BITMAPINFO()
+                bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+                bmi.bmiHeader.biWidth = width
+                bmi.bmiHeader.biHeight = -height
+                bmi.bmiHeader.biPlanes = 1
+                bmi.bmiHeader.biBitCount = 32
+                bmi.bmiHeader.biCompression = 0
+
+                cache = self._dib_cache = (hwnd, width, height, hwnd_dc, mem_dc, bmp, bmi)
+            _, _, _, hwnd_dc, mem_dc, bmp, bmi = cache
 
             PW_RENDERFULLCONTENT = 0x00000002
             result = user32.PrintWindow(hwnd, mem_dc, PW_RENDERFULLCONTENT)
             if not result:
                 gdi32.BitBlt(mem_dc, 0, 0, width, height, hwnd_dc, 0, 0, 0x00CC0020)
 
-            bmi = BITMAPINFO()
-            bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
-            bmi.bmiHeader.biWidth = width
-            bmi.bmiHeader.biHeight = -height
-            bmi.bmiHeader.biPlanes = 1
-            bmi.bmiHeader.biBitCount = 32
-            bmi.bmiHeader.biCompression = 0
-
-            buf_size = width * height * 4
-            buffer = (ctypes.c_ubyte * buf_size)()
-            gdi32.GetDIBits(mem_dc, bmp, 0, height, buffer, ctypes.byref(bmi), 0)
+            # GetDIBits writes straight into the new image's pixels (32 bpp top-down rows match
+            # RGB32's stride), so there is no intermediate ctypes buffer and no copy. RGB32, not
+            # ARGB32: GDI leaves the alpha byte undefined, and an opaque format converts to a
+            # pixmap without a premultiply pass
+            qimg = QImage(width, height, QImage.Format_RGB32)
+            pixels = (ctypes.c_ubyte * qimg.sizeInBytes()).from_buffer(qimg.bits())
+            lines = gdi32.GetDIBits(mem_dc, bmp, 0, height, pixels, ctypes.byref(bmi), 0)
+            del pixels
+            return qimg if lines else None
+        except Exception:
+            return None
 
+    def _release_dib_cache(self) -> None:
+        cache, self._dib_cache = self._dib_cache, None
+        if cache is None:
+            return
+        hwnd, _, _, hwnd_dc, mem_dc, bmp, _ = cache
+        try:
+            gdi32 = ctypes.windll.gdi32
             gdi32.DeleteObject(bmp)
             gdi32.DeleteDC(mem_dc)
-            user32.ReleaseDC(hwnd, hwnd_dc)
-
-            qimg = QImage(bytes(buffer), width, height, QImage.Format_ARGB32)
-            return qimg.copy()
+            ctypes.windll.user32.ReleaseDC(hwnd, hwnd_dc)
         except Exception:
-            return None
+            pass
 
-    def _read_stderr(self) -> None:
-        if not self._proc or not self._proc.stderr:
+    def _read_log_output(self, stream) -> None:
+        if stream is None:
             return
         try:
-            for line in self._proc.stderr:
-                if not self._running:
-                    break
-                msg = line.decode("utf-8", errors="replace").strip()
-                if msg:
-                    self.log_line.emit(msg)
-                    if self._raw_requested and not self._raw_failed:
+            for lines in _read_line_batches(stream, lambda: self._running):
+                self.log_lines.emit(lines)
+                if self._raw_requested and not self._raw_failed:
+                    for msg in lines:
                         lower = msg.lower()
                         if "raw-video" in lower and ("unknown" in lower or "unrecognized" in lower or "invalid" in lower):
                             self._raw_failed = True
@@ -438,22 +847,6 @@ class ScrcpyVideoSource(QObject):
         except Exception:
             pass
 
-    def _read_stdout(self) -> None:
-        if not self._proc or not self._proc.stdout:
-            return
-        try:
-            for line in self._proc.stdout:
-                if not self._running:
-                    break
-                if isinstance(line, bytes):
-                    msg = line.decode("utf-8", errors="replace").strip()
-                else:
-                    msg = str(line).strip()
-                if msg:
-                    self.log_line.emit(msg)
-        except Exception:
-            pass
-
     def _start_adb_fallback(self) -> None:
         if self._fallback_source:
             return
@@ -516,51 +909,57 @@ class HierarchyThread(QThread):
     Slower XML Loop (Async).
     Polls for UI XML changes at a lower frequency than video.
     """
-    tree_ready = Signal(str, bool) # Emits (XML String, is_changed)
+    tree_ready = Signal(str, bool, object) # Emits (XML String, is_changed, (root UiNode, parse_error))
     dump_error = Signal(str)
     
     def __init__(self, serial: str):
         super().__init__()
         self.serial = serial
         self.running = True
-        self.last_hash = ""
+        self.last_xml = ""
         self._refresh_event = threading.Event()
         self._last_error_ts = 0.0
         self.poll_interval_s = 1.5
+        self.max_idle_interval_s = 5.0
 
     def run(self) -> None:
+        unchanged = 0
         while self.running:
             try:
                 xml_str = AdbManager.get_xml_dump(self.serial)
                 if xml_str and len(xml_str) > 50:
-                    # Only emit if changed to save UI repainting costs
-                    cur_hash = hashlib.md5(xml_str.encode()).hexdigest()
-                    if cur_hash != self.last_hash:
-                        self.last_hash = cur_hash
-                        self.tree_ready.emit(xml_str, True)
+                    # Only emit if changed to save UI repainting costs.
+                    # Direct comparison: no encode() copy and no digest over the whole dump.
+                    if xml_str != self.last_xml:
+                        self.last_xml = xml_str
+                        unchanged = 0
+                        # Parse here so the GUI thread only swaps the tree in
+                        self.tree_ready.emit(xml_str, True, UixParser.parse(xml_str))
                     else:
-                        # Optional: Emit False if you want to confirm "still same"
-                        pass
+                        unchanged += 1
                 else:
                     err = AdbManager.get_last_dump_error()
-                    now = time.time()
+                    now = time.monotonic()
                     if err and (now - self._last_error_ts) > 5.0:
                         self._last_error_ts = now
                         self.dump_error.emit(f"UI dump failed: {err}")
             except Exception:
                 pass
             
-            # Poll hierarchy less frequently than video.
-            loop_count = max(1, int(self.poll_interval_s / 0.1))
-            for _ in range(loop_count):
-                if not self.running: 
-                    break
-                if self._refresh_event.wait(timeout=0.1):
-                    self._refresh_event.clear()
-                    break
+            # Poll hierarchy less frequently than video; one wait that a refresh request
+            # or stop() cuts short
+            if self.running and self._refresh_event.wait(timeout=self.idle_interval(unchanged)):
+                self._refresh_event.clear()
+                unchanged = 0
+
+    def idle_interval(self, unchanged: int) -> float:
+        """Poll interval after `unchanged` identical dumps: each uiautomator dump is costly on the device."""
+        base = self.poll_interval_s
+        return min(max(base, self.max_idle_interval_s), base * (2 ** min(unchanged, 3)))
 
     def stop(self) -> None:
         self.running = False
+        self._refresh_event.set()
         self.wait()
 
     def request_refresh(self) -> None:
@@ -572,9 +971,10 @@ class HierarchyThread(QThread):
 class LogcatThread(QThread):
     """ 
     Real-time Log Stream.
-    Reads 'adb logcat' output line by line.
+    Reads 'adb logcat' output in binary chunks and emits complete lines in batches.
     """
-    log_line = Signal(str)
+    log_lines = Signal(list) # Emits a list of decoded lines
+    batch_size = 200
     
     def __init__(self, serial: str):
         super().__init__()
@@ -594,25 +994,28 @@ class LogcatThread(QThread):
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            encoding='utf-8',
-            errors='replace'
         )
         
         if self.proc and self.proc.stdout:
-            while self.running:
-                # Type safe read
-                line = self.proc.stdout.readline()
-                if not line:
-                    break
-                if line.strip():
-                    self._emit_counter += 1
-                    if self._emit_counter % max(1, self.emit_every_n) == 0:
-                        self.log_line.emit(line.strip())
+            for lines in _read_line_batches(self.proc.stdout, lambda: self.running):
+                self._emit_lines(lines)
         
         if self.proc: 
             self.proc.terminate()
 
+    def _emit_lines(self, lines: List[str]) -> None:
+        every_n = max(1, self.emit_every_n)
+        if every_n == 1:
+            batch = lines
+        else:
+            batch = []
+            for line in lines:
+                self._emit_counter += 1
+                if self._emit_counter % every_n == 0:
+                    batch.append(line)
+        for i in range(0, len(batch), self.batch_size):
+            self.log_lines.emit(batch[i:i + self.batch_size])
+
     def stop(self) -> None:
         self.running = False
         if self.proc: 
@@ -636,15 +1039,30 @@ class FocusMonitorThread(QThread):
         self.serial = serial
         self.running = True
         self.poll_interval_s = 1.0
+        self.max_idle_interval_s = 5.0
     
     def run(self) -> None:
         last_focus = ""
+        unchanged = 0
         while self.running:
             f = AdbManager.get_current_focus(self.serial)
             if f != last_focus:
                 last_focus = f
+                unchanged = 0
                 self.focus_changed.emit(f)
-            time.sleep(max(0.2, self.poll_interval_s))
+            else:
+                unchanged += 1
+            # Sleep in short slices so stop() does not wait out a long idle interval
+            loop_count = max(1, int(self.idle_interval(unchanged) / 0.1))
+            for _ in range(loop_count):
+                if not self.running:
+                    break
+                self.msleep(100)
+
+    def idle_interval(self, unchanged: int) -> float:
+        """Poll interval after `unchanged` polls with the same focus: backs off while the device is idle."""
+        base = max(0.2, self.poll_interval_s)
+        return min(max(base, self.max_idle_interval_s), base * (1.5 ** min(unchanged, 5)))
             
     def stop(self) -> None:
         self.running = False
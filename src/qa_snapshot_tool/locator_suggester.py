@@ -6,9 +6,14 @@ based on the properties of a selected `UiNode`. It prioritizes "scoped" locators
 that rely on stable parent anchors.
 """
 
+import re
 from typing import List, Dict, Optional, Any, Union
 from qa_snapshot_tool.uix_parser import UiNode
 
+# Generic IDs we hate as anchors, matched in one pass
+_BAD_ANCHOR_ID_RE = re.compile(r"android:id/content|android:id/body|id/container")
+_UNSET = object()
+
 class LocatorUtils:
     """Utility functions for string escaping in XPath."""
     
@@ -18,14 +23,10 @@ class LocatorUtils:
         Escapes single quotes in text for use in XPath expressions.
         Example: "User's" -> concat("User", "'", "s")
         """
-        if "'" in text:
-            parts = text.split("'")
-            # Wrap each part in single quotes
-            args = [f"'{p}'" for p in parts]
-            # Join with the escaped single quote
-            concat = ", \"'\", ".join(args)
-            return f"concat({concat})"
-        return f"'{text}'"
+        if "'" not in text:
+            return f"'{text}'"
+        # Each quote closes the current literal, adds a double-quoted "'" and opens the next one
+        return "concat('" + "', \"'\", '".join(text.split("'")) + "')"
 
 class LocatorSuggester:
     """
@@ -83,24 +84,39 @@ class LocatorSuggester:
 
         return suggestions
 
+    @staticmethod
+    def _find_anchor(node: UiNode) -> Optional[UiNode]:
+        """
+        Nearest ancestor with a stable resource-id. Memoized on the nodes walked
+        (a parsed tree never changes), so siblings and repeat clicks reuse the walk.
+        """
+        chain = []
+        curr = node
+        while True:
+            anchor = getattr(curr, "_anchor", _UNSET)
+            if anchor is not _UNSET:
+                break
+            chain.append(curr)
+            parent = curr.parent
+            if parent is None:
+                anchor = None
+                break
+            if parent.resource_id and not _BAD_ANCHOR_ID_RE.search(parent.resource_id):
+                anchor = parent
+                break
+            curr = parent
+        # Every node walked had only generic ancestors up to here, so they share the anchor
+        for walked in chain:
+            walked._anchor = anchor
+        return anchor
+
     @staticmethod
     def _generate_scoped_locator(node: UiNode) -> Optional[Dict[str, Union[str, int]]]:
         """
         Tries to find a parent with a stable resource-id (Anchor) and builds a relative xpath.
         """
         # 1. Find Anchor
-        anchor: Optional[UiNode] = None
-        curr = node.parent
-        bad_ids = ["android:id/content", "android:id/body", "id/container"] # Generic IDs we hate
-        
-        while curr:
-            if curr.resource_id:
-                is_bad = any(b in curr.resource_id for b in bad_ids)
-                if not is_bad:
-                    anchor = curr
-                    break
-            curr = curr.parent
-            
+        anchor = LocatorSuggester._find_anchor(node)
         if not anchor: 
             return None
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import time
 from pathlib import Path
@@ -79,17 +80,21 @@ def _build_bookmark_entries(bookmarks_root: Path) -> List[Dict[str, str]]:
     if not bookmarks_root.exists():
         return []
     entries: List[Dict[str, str]] = []
-    for folder in sorted([p for p in bookmarks_root.iterdir() if p.is_dir()], key=lambda p: p.name):
-        payload: Dict[str, str] = {"bookmark_id": folder.name}
+    with os.scandir(bookmarks_root) as it:
+        folders = sorted((e.name for e in it if e.is_dir()))
+    for name in folders:
+        payload: Dict[str, str] = {"bookmark_id": name}
+        # One listing per bookmark instead of an exists() probe per artifact
+        with os.scandir(bookmarks_root / name) as it:
+            present = {e.name for e in it}
         for filename, key in (
             ("screenshot.png", "screenshot"),
             ("dump.uix", "dump"),
             ("logcat.txt", "logcat"),
             ("meta.json", "meta"),
         ):
-            path = folder / filename
-            if path.exists():
-                payload[key] = path.relative_to(bookmarks_root.parent).as_posix()
+            if filename in present:
+                payload[key] = f"{bookmarks_root.name}/{name}/{filename}"
         entries.append(payload)
     return entries
 
@@ -53,7 +53,7 @@ def main() -> None:
     """
     try:
         try:
-            from PySide6.QtGui import QFont, QFontDatabase, QIcon
+            from PySide6.QtGui import QFont, QFontDatabase, QIcon, QPixmapCache
             from PySide6.QtCore import QLoggingCategory
             from PySide6.QtWidgets import QApplication
             from qa_snapshot_tool.gui import MainWindow
@@ -67,20 +67,28 @@ def main() -> None:
         QLoggingCategory.setFilterRules("qt.multimedia.*=false\\nqt.multimedia.ffmpeg.*=false")
         app = QApplication(sys.argv)
         app.setApplicationName("QUANTUM Inspector")
+        # Room for a few decoded snapshot screenshots (KB); the 10 MB default fits none at 1:1
+        QPixmapCache.setCacheLimit(64 * 1024)
 
         root = get_app_root()
         fonts_dir = root / "assets" / "fonts"
+        loaded_families = []
         if fonts_dir.exists():
-            loaded_families = []
-            for font_path in list(fonts_dir.rglob("*.ttf")) + list(fonts_dir.rglob("*.otf")):
+            # One walk over the fonts tree; TrueType first so the default family pick is unchanged
+            font_paths = {".ttf": [], ".otf": []}
+            for path in fonts_dir.rglob("*"):
+                bucket = font_paths.get(path.suffix.lower())
+                if bucket is not None:
+                    bucket.append(path)
+            for font_path in font_paths[".ttf"] + font_paths[".otf"]:
                 font_id = QFontDatabase.addApplicationFont(str(font_path))
                 if font_id != -1:
                     loaded_families.extend(QFontDatabase.applicationFontFamilies(font_id))
 
         font_family = "BMW Type Next"
-        if "loaded_families" in locals() and loaded_families:
+        if loaded_families:
             font_family = loaded_families[0]
-        if font_family not in QFontDatabase.families():
+        if not QFontDatabase.hasFamily(font_family):
             font_family = "Segoe UI"
 
         Theme.FONT_FAMILY = font_family
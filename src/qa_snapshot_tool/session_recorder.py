@@ -12,7 +12,7 @@ import time
 import traceback
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from PySide6.QtCore import QBuffer, QByteArray, QIODevice
 from PySide6.QtGui import QImage
@@ -213,18 +213,19 @@ class SessionRecorder:
             if digest == self._last_frame_hash and (now - self._last_frame_ts) < 2.5:
                 return None
 
-        rel = Path("frames") / f"{int(now * 1000)}_{reason}.png"
+        # Stored with forward slashes on every OS; built once for the file and both rows
+        rel = f"frames/{int(now * 1000)}_{reason}.png"
         out = self.session_dir / rel
         out.write_bytes(png)
 
         with self._lock:
             self._db.execute(
                 "INSERT INTO frames(ts, reason, file_relpath, width, height, sha1) VALUES (?, ?, ?, ?, ?, ?)",
-                (now, reason, str(rel).replace("\\", "/"), image.width(), image.height(), digest),
+                (now, reason, rel, image.width(), image.height(), digest),
             )
             self._db.execute(
                 "INSERT INTO events(ts, kind, payload_json, file_relpath) VALUES (?, ?, ?, ?)",
-                (now, "frame", json.dumps({"reason": reason}), str(rel).replace("\\", "/")),
+                (now, "frame", json.dumps({"reason": reason}), rel),
             )
             self._db.commit()
 
@@ -237,16 +238,18 @@ class SessionRecorder:
         if self._finished or not xml:
             return None
         now = time.time()
-        digest = hashlib.md5(xml.encode("utf-8", errors="replace")).hexdigest()
+        # Encoded once, then shared by the digest, the file and the compressed copy
+        data = xml.encode("utf-8", errors="replace")
+        digest = hashlib.md5(data).hexdigest()
         if reason == "changed" and digest == self._last_xml_hash:
             return None
 
-        rel = Path("xml") / f"{int(now * 1000)}_{reason}.uix"
+        rel = f"xml/{int(now * 1000)}_{reason}.uix"
         out = self.session_dir / rel
-        out.write_text(xml, encoding="utf-8", errors="replace")
-        if out.stat().st_size > 512 * 1024:
+        out.write_bytes(data)
+        if len(data) > 512 * 1024:
             try:
-                compressed = compress_payload(xml.encode("utf-8", errors="replace"))
+                compressed = compress_payload(data)
                 (out.with_suffix(".uix.z")).write_bytes(compressed)
             except Exception:
                 pass
@@ -254,11 +257,11 @@ class SessionRecorder:
         with self._lock:
             self._db.execute(
                 "INSERT INTO xml_dumps(ts, reason, file_relpath, md5, size_bytes) VALUES (?, ?, ?, ?, ?)",
-                (now, reason, str(rel).replace("\\", "/"), digest, out.stat().st_size),
+                (now, reason, rel, digest, len(data)),
             )
             self._db.execute(
                 "INSERT INTO events(ts, kind, payload_json, file_relpath) VALUES (?, ?, ?, ?)",
-                (now, "xml_dump", json.dumps({"reason": reason}), str(rel).replace("\\", "/")),
+                (now, "xml_dump", json.dumps({"reason": reason}), rel),
             )
             self._db.commit()
 
@@ -267,16 +270,20 @@ class SessionRecorder:
         return out
 
     def record_log_line(self, message: str, source: str = "logcat") -> None:
-        if self._finished:
+        self.record_log_lines([message], source=source)
+
+    def record_log_lines(self, messages: List[str], source: str = "logcat") -> None:
+        # One file append and one commit per batch rather than per line
+        if self._finished or not messages:
             return
         now = time.time()
-        line = f"[{time.strftime('%H:%M:%S', time.localtime(now))}] {message}\n"
+        stamp = time.strftime('%H:%M:%S', time.localtime(now))
         with self.log_path.open("a", encoding="utf-8", errors="replace") as handle:
-            handle.write(line)
+            handle.write("".join(f"[{stamp}] {message}\n" for message in messages))
         with self._lock:
-            self._db.execute(
+            self._db.executemany(
                 "INSERT INTO logs(ts, source, message) VALUES (?, ?, ?)",
-                (now, source, message),
+                [(now, source, message) for message in messages],
             )
             self._db.commit()
 
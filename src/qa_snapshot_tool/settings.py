@@ -16,6 +16,7 @@ class AppSettings:
     emulator_beta_enabled: bool = False
     maestro_workspace_path: str = ""
     auto_record_live: bool = True
+    opengl_viewport: bool = False
 
     @staticmethod
     def config_path() -> Path:
@@ -34,6 +35,7 @@ class AppSettings:
         merged["emulator_beta_enabled"] = bool(merged["emulator_beta_enabled"])
         merged["maestro_workspace_path"] = str(merged["maestro_workspace_path"] or "")
         merged["auto_record_live"] = bool(merged["auto_record_live"])
+        merged["opengl_viewport"] = bool(merged["opengl_viewport"])
         return AppSettings(**merged)
 
     @classmethod
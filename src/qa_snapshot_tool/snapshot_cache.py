@@ -0,0 +1,151 @@
+"""On-disk cache of parsed dumps and decoded screenshots for reopened snapshots."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PySide6.QtGui import QImage
+
+from qa_snapshot_tool.uix_parser import UiNode
+
+CACHE_MAX_FILES = 256
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Bumped whenever the pickled payload layout or UiNode's fields change
+TREE_FORMAT = 1
+# Qt maps PNG quality q to zlib level (100 - q) * 9 / 91; 80 gives level 1,
+# the fastest level that still compresses (90 and up store raw pixels)
+IMAGE_PNG_QUALITY = 80
+
+
+def cache_dir() -> Path:
+    base = Path.home() / ".qa_snapshot_tool" / "cache"
+    base.mkdir(parents=True, exist_ok=True, mode=0o700)
+    return base
+
+
+def _source_identity(path: str) -> Optional[Tuple[str, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
+
+def cache_key(path: str, variant: str = "") -> Optional[str]:
+    """Key for a source file; changes whenever the file's mtime or size does."""
+    ident = _source_identity(path)
+    if ident is None:
+        return None
+    raw = "{}:{}:{}:{}".format(*ident, variant)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def load_tree(path: str) -> Optional[Tuple[UiNode, bool]]:
+    ident = _source_identity(path)
+    key = cache_key(path)
+    if not key:
+        return None
+    try:
+        with open(cache_dir() / f"{key}.uix.pkl", "rb") as f:
+            fmt, source, root, is_error = pickle.load(f)
+    except Exception:
+        # Truncated, foreign or stale-format entries of any kind: parse instead
+        return None
+    # The entry must describe this exact file, not just share its key
+    if fmt != TREE_FORMAT or source != ident or not isinstance(root, UiNode):
+        return None
+    return root, bool(is_error)
+
+
+def store_tree(path: str, root: UiNode, is_error: bool) -> None:
+    ident = _source_identity(path)
+    key = cache_key(path)
+    if not key:
+        return
+    target = cache_dir() / f"{key}.uix.pkl"
+    try:
+        data = pickle.dumps((TREE_FORMAT, ident, root, is_error), protocol=pickle.HIGHEST_PROTOCOL)
+    except (RecursionError, pickle.PicklingError):
+        return # too deep to pickle; parsing stays the fallback
+    _write_atomic(target, data)
+    prune()
+
+
+def image_path(path: str, width: int, height: int) -> Optional[Path]:
+    """Cache file for the screenshot decoded at the given size (no rescale on reload)."""
+    key = cache_key(path, f"{width}x{height}")
+    if not key:
+        return None
+    return cache_dir() / f"{key}.png"
+
+
+def load_image(target: Path) -> Optional[QImage]:
+    if not target.is_file():
+        return None
+    img = QImage(str(target))
+    return None if img.isNull() else img
+
+
+def store_image(target: Path, img: QImage) -> None:
+    tmp = _tmp_path(target)
+    if img.save(str(tmp), "PNG", IMAGE_PNG_QUALITY):
+        try:
+            os.replace(tmp, target)
+        except OSError:
+            _discard(tmp)
+        prune()
+    else:
+        _discard(tmp)
+
+
+def prune(max_files: int = CACHE_MAX_FILES, max_bytes: int = CACHE_MAX_BYTES) -> None:
+    """Drop the least recently written entries until at most max_files and max_bytes remain."""
+    try:
+        with os.scandir(cache_dir()) as it:
+            entries = []
+            for e in it:
+                if e.is_file():
+                    st = e.stat()
+                    entries.append((st.st_mtime, st.st_size, e.path))
+    except OSError:
+        return
+    count = len(entries)
+    total = sum(size for _, size, _ in entries)
+    if count <= max_files and total <= max_bytes:
+        return
+    entries.sort()
+    for _, size, p in entries:
+        if count <= max_files and total <= max_bytes:
+            break
+        try:
+            os.remove(p)
+        except OSError:
+            continue
+        count -= 1
+        total -= size
+
+
+def _tmp_path(target: Path) -> Path:
+    # Unique per writer: decode tasks may store the same entry from several pool threads
+    return target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _discard(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def _write_atomic(target: Path, data: bytes) -> None:
+    tmp = _tmp_path(target)
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+    except OSError:
+        _discard(tmp)
@@ -5,6 +5,8 @@ Defines the color palette, fonts, and QSS style sheets used throughout the appli
 Designed for a modern "Dark Mode" aesthetic similar to VS Code or JetBrains IDEs.
 """
 
+from functools import lru_cache
+
 from PySide6.QtGui import QColor
 
 class Theme:
@@ -47,6 +49,12 @@ class Theme:
         """
         Returns the global QSS stylesheet for the application.
         """
+        # FONT_FAMILY is set at startup after font loading, so it is part of the key
+        return Theme._build_stylesheet(Theme.FONT_FAMILY, ambient_overlay, use_translucent)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _build_stylesheet(font_family: str, ambient_overlay: str, use_translucent: bool) -> str:
         panel_bg = "rgba(22, 26, 32, 200)" if use_translucent else Theme.BG_PANEL
         header_bg = "rgba(26, 31, 39, 200)" if use_translucent else Theme.BG_HEADER
         dark_bg = "rgba(16, 19, 23, 220)" if use_translucent else Theme.BG_DARK
@@ -59,7 +67,7 @@ class Theme:
         
         QWidget {{
             color: {Theme.TEXT_WHITE};
-            font-family: '{Theme.FONT_FAMILY}', '{Theme.FONT_FALLBACK}', sans-serif;
+            font-family: '{font_family}', '{Theme.FONT_FALLBACK}', sans-serif;
             font-size: 10pt;
         }}
 
@@ -106,19 +114,19 @@ class Theme:
         }}
         
         /* Lists & Trees */
-        QTreeWidget, QListWidget {{
+        QTreeView, QListWidget {{
             background-color: {panel_bg};
             border: 1px solid {Theme.BORDER};
             outline: none;
         }}
-        QTreeWidget::item, QListWidget::item {{
+        QTreeView::item, QListWidget::item {{
             padding: 4px;
         }}
-        QTreeWidget::item:selected, QListWidget::item:selected {{
+        QTreeView::item:selected, QListWidget::item:selected {{
             background-color: #37373d;
             color: white;
         }}
-        QTreeWidget::item:hover, QListWidget::item:hover {{
+        QTreeView::item:hover, QListWidget::item:hover {{
             background-color: #2a2d2e;
         }}
 
@@ -160,13 +168,13 @@ class Theme:
         }}
 
         /* Inputs */
-        QLineEdit, QTextEdit {{
+        QLineEdit, QTextEdit, QPlainTextEdit {{
             background-color: {dark_bg};
             border: 1px solid {Theme.BORDER};
             padding: 4px;
             color: {Theme.TEXT_WHITE};
         }}
-        QLineEdit:focus, QTextEdit:focus {{
+        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {{
             border: 1px solid {Theme.BMW_BLUE};
         }}
         
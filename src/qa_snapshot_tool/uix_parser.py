@@ -8,12 +8,27 @@ tree of `UiNode` objects. It handles bounds parsing, validation, and tree traver
 import xml.etree.ElementTree as ET
 import re
 import hashlib
+from sys import intern as _intern
 from typing import Optional, List, Tuple, Union, Any
 
+_XML_DECL_RE = re.compile(r'<\?xml.*?\?>')
+# Zero-size wrappers and nodes without a bounds attribute
+_EMPTY_BOUNDS = '[0,0][0,0]'
+
 class UiNode:
     """
     Represents a single UI element in the Android view hierarchy.
     """
+    # Thousands per dump: slots drop the per-instance __dict__.
+    # `_anchor` is the memo LocatorSuggester._find_anchor stores on walked nodes.
+    __slots__ = (
+        'parent', 'children',
+        'text', 'resource_id', 'class_name', 'package', 'content_desc', 'index',
+        'checkable', 'checked', 'clickable', 'enabled', 'focusable', 'focused',
+        'scrollable', 'long_clickable', 'password', 'selected', 'naf',
+        'bounds_str', 'rect', 'valid_bounds', '_fingerprint', '_anchor',
+    )
+
     def __init__(self, element: ET.Element, parent: Optional['UiNode'] = None):
         """
         initializes a UiNode from an XML element.
@@ -22,43 +37,45 @@ class UiNode:
             element (ET.Element): The raw XML element.
             parent (Optional[UiNode]): The parent node in the logical tree.
         """
-        self.element: ET.Element = element
+        # The element is only read here, not kept: the parsed DOM can be freed
+        # once the UiNode tree is built (and is not pickled into the snapshot cache)
         self.parent: Optional['UiNode'] = parent
         self.children: List['UiNode'] = []
         
+        # One dict for ~20 lookups instead of an Element.get call each
+        attrs = element.attrib
+
         # String Attributes
-        self.text: str = element.get('text', '')
-        self.resource_id: str = element.get('resource-id', '')
-        self.class_name: str = element.get('class', '')
-        self.package: str = element.get('package', '')
-        self.content_desc: str = element.get('content-desc', '')
-        self.index: str = element.get('index', '0')
+        self.text: str = attrs.get('text', '')
+        # Few distinct values per dump, but expat hands out a fresh str per node: share them
+        self.resource_id: str = _intern(attrs.get('resource-id', ''))
+        self.class_name: str = _intern(attrs.get('class', ''))
+        self.package: str = _intern(attrs.get('package', ''))
+        self.content_desc: str = attrs.get('content-desc', '')
+        self.index: str = attrs.get('index', '0')
         
         # Boolean Flags (Crucial for validation and filtering)
-        self.checkable: bool = element.get('checkable', 'false') == 'true'
-        self.checked: bool = element.get('checked', 'false') == 'true'
-        self.clickable: bool = element.get('clickable', 'false') == 'true'
-        self.enabled: bool = element.get('enabled', 'false') == 'true'
-        self.focusable: bool = element.get('focusable', 'false') == 'true'
-        self.focused: bool = element.get('focused', 'false') == 'true'
-        self.scrollable: bool = element.get('scrollable', 'false') == 'true'
-        self.long_clickable: bool = element.get('long-clickable', 'false') == 'true'
-        self.password: bool = element.get('password', 'false') == 'true'
-        self.selected: bool = element.get('selected', 'false') == 'true'
+        self.checkable: bool = attrs.get('checkable', 'false') == 'true'
+        self.checked: bool = attrs.get('checked', 'false') == 'true'
+        self.clickable: bool = attrs.get('clickable', 'false') == 'true'
+        self.enabled: bool = attrs.get('enabled', 'false') == 'true'
+        self.focusable: bool = attrs.get('focusable', 'false') == 'true'
+        self.focused: bool = attrs.get('focused', 'false') == 'true'
+        self.scrollable: bool = attrs.get('scrollable', 'false') == 'true'
+        self.long_clickable: bool = attrs.get('long-clickable', 'false') == 'true'
+        self.password: bool = attrs.get('password', 'false') == 'true'
+        self.selected: bool = attrs.get('selected', 'false') == 'true'
         
         # NAF (Not A Focusable) Logic - often indicates layout wrappers
-        self.naf: bool = element.get('NAF', 'false') == 'true'
+        self.naf: bool = attrs.get('NAF', 'false') == 'true'
         if not self.text and not self.resource_id and not self.content_desc:
             self.naf = True
 
         # Bounds Parsing
         # Standard format: "[x1,y1][x2,y2]"
-        self.bounds_str: str = element.get('bounds', '[0,0][0,0]')
+        self.bounds_str: str = attrs.get('bounds', _EMPTY_BOUNDS)
         self.rect: Tuple[int, int, int, int] = (0, 0, 0, 0) # x, y, w, h
         self.valid_bounds: bool = self.parse_bounds(self.bounds_str)
-        
-        # Fingerprint for re-selection persistence
-        self.fingerprint: str = self._generate_fingerprint()
 
     def parse_bounds(self, bounds_str: str) -> bool:
         """
@@ -70,17 +87,28 @@ class UiNode:
         Returns:
             bool: True if bounds are valid (width > 0 and height > 0), False otherwise.
         """
+        if bounds_str == _EMPTY_BOUNDS:
+            self.rect = (0, 0, 0, 0)
+            return False
+        # Fixed "[x1,y1][x2,y2]" layout: plain splits beat the regex engine, and this runs per node
         try:
-            matches = re.findall(r'\[([-]?\d+),([-]?\d+)\]', bounds_str)
-            if len(matches) == 2:
-                x1, y1 = map(int, matches[0])
-                x2, y2 = map(int, matches[1])
-                w, h = x2 - x1, y2 - y1
-                self.rect = (x1, y1, w, h)
-                return w > 0 and h > 0
-        except Exception: 
-            pass
-        return False
+            first, second = bounds_str[1:-1].split("][", 1)
+            x1, y1 = first.split(",")
+            x2, y2 = second.split(",")
+            x1, y1 = int(x1), int(y1)
+            w, h = int(x2) - x1, int(y2) - y1
+        except ValueError:
+            return False
+        self.rect = (x1, y1, w, h)
+        return w > 0 and h > 0
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint for re-selection persistence, hashed on first access (most nodes never need one)."""
+        fp = getattr(self, '_fingerprint', None)
+        if fp is None:
+            fp = self._fingerprint = self._generate_fingerprint()
+        return fp
 
     def _generate_fingerprint(self) -> str:
         """
@@ -153,36 +181,39 @@ class UixParser:
             if isinstance(source, bytes) or (isinstance(source, str) and source.strip().startswith("<")):
                 if isinstance(source, bytes): 
                     source = source.decode('utf-8', errors='replace')
-                # Remove XML declaration if present to avoid encoding issues
-                source = re.sub(r'<\?xml.*?\?>', '', source)
+                # Trimming to the <hierarchy>/<node> block already drops a leading XML
+                # declaration; the full-text regex only runs if one is still left inside
                 source = UixParser._sanitize_xml(source)
+                if "<?xml" in source:
+                    # Remove XML declaration if present to avoid encoding issues
+                    source = _XML_DECL_RE.sub('', source)
                 root_element = ET.fromstring(source)
             else:
                 # Assume it's a file path
                 tree = ET.parse(source)
                 root_element = tree.getroot()
             
-            # Recursive Builder
-            valid_count: int = 0
-            total_nodes: int = 0
-
-            def build(element: ET.Element, parent: Optional[UiNode] = None) -> UiNode:
-                nonlocal valid_count, total_nodes
-                node = UiNode(element, parent)
-                total_nodes += 1
-                if node.valid_bounds: 
-                    valid_count += 1
-                
-                for child in element:
-                    node.add_child(build(child, node))
-                return node
-
-            # Handle basic wrapper tags like <hierarchy>
+            # Iterative builder: an explicit stack avoids a Python frame per node
+            # and the recursion limit on very deep dumps
             start_element = root_element
             if root_element.tag == 'hierarchy' and len(root_element) > 0:
                 start_element = root_element[0]
-            
-            root_node = build(start_element)
+
+            root_node = UiNode(start_element)
+            total_nodes: int = 1
+            valid_count: int = 1 if root_node.valid_bounds else 0
+            stack = [(start_element, root_node)]
+            pop, push = stack.pop, stack.append
+            while stack:
+                element, node = pop()
+                for child_element in element:
+                    child = UiNode(child_element, node)
+                    node.add_child(child)
+                    total_nodes += 1
+                    if child.valid_bounds:
+                        valid_count += 1
+                    if len(child_element):
+                        push((child_element, child))
             
             # Heuristic: If we parsed nodes but ALL have 0 bounds, something is presumably wrong 
             # (or it's a non-visual dump)
@@ -0,0 +1,121 @@
+"""Lazy item model exposing a parsed UiNode tree to a QTreeView."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+from qa_snapshot_tool.uix_parser import UiNode
+
+
+def node_label(node: UiNode) -> str:
+    name = f"{node.class_name.split('.')[-1]}"
+    if node.resource_id:
+        name += f" ({node.resource_id.split('/')[-1]})"
+    elif node.text:
+        name += f" \"{node.text}\""
+    return name
+
+
+class UixTreeModel(QAbstractItemModel):
+    """Wraps the UiNode tree directly; the view only asks for rows it shows.
+
+    Indexes carry the UiNode as their internal pointer, so no per-node item
+    objects are created. Row positions are computed in one pass when the root
+    is set, and labels are built on first display.
+    """
+
+    def __init__(self, header: str = "UI Tree", parent=None) -> None:
+        super().__init__(parent)
+        self.header = header
+        self.root: Optional[UiNode] = None
+        self._rows: Dict[int, int] = {}
+        self._labels: Dict[int, str] = {}
+
+    def set_root(self, root: Optional[UiNode]) -> None:
+        self.beginResetModel()
+        self.root = root
+        self._labels = {}
+        rows: Dict[int, int] = {}
+        if root is not None:
+            rows[id(root)] = 0
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                children = node.children
+                for row, child in enumerate(children):
+                    rows[id(child)] = row
+                stack.extend(children)
+        self._rows = rows
+        self.endResetModel()
+
+    def node_count(self) -> int:
+        return len(self._rows)
+
+    def contains(self, node: Any) -> bool:
+        row = self._rows.get(id(node))
+        if row is None:
+            return False
+        # Guards against a recycled id() from a previous tree
+        siblings = node.parent.children if node.parent is not None else [self.root]
+        return row < len(siblings) and siblings[row] is node
+
+    def node(self, index: QModelIndex) -> Optional[UiNode]:
+        if not index.isValid():
+            return None
+        return index.internalPointer()
+
+    def index_for_node(self, node: Any) -> QModelIndex:
+        if not self.contains(node):
+            return QModelIndex()
+        return self.createIndex(self._rows[id(node)], 0, node)
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row == 0 and self.root is not None:
+                return self.createIndex(0, 0, self.root)
+            return QModelIndex()
+        children = parent.internalPointer().children
+        if row >= len(children):
+            return QModelIndex()
+        return self.createIndex(row, 0, children[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        up = index.internalPointer().parent
+        if up is None:
+            return QModelIndex()
+        return self.createIndex(self._rows.get(id(up), 0), 0, up)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        if not parent.isValid():
+            return 1 if self.root is not None else 0
+        return len(parent.internalPointer().children)
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return self.root is not None
+        return bool(parent.internalPointer().children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        node = index.internalPointer()
+        label = self._labels.get(id(node))
+        if label is None:
+            label = self._labels[id(node)] = node_label(node)
+        return label
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return self.header
+        return None
@@ -1,8 +1,10 @@
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=None)
 def get_app_root() -> Path:
-    """Returns the application root directory (repo root in dev, _MEIPASS in frozen)."""
+    """Returns the application root directory (repo root in dev, _MEIPASS in frozen). Resolved once per process."""
     if getattr(sys, 'frozen', False):
         return Path(sys._MEIPASS)
     return Path(__file__).resolve().parents[2]
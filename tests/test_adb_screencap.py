@@ -0,0 +1,91 @@
+import struct
+import sys
+
+from qa_snapshot_tool import live_mirror
+from qa_snapshot_tool.adb_manager import AdbManager, RawCaptureSession
+from qa_snapshot_tool.live_mirror import VideoThread
+
+
+PIXELS = bytes([10, 20, 30, 255]) * 6
+
+
+def test_parse_raw_screencap_accepts_both_header_layouts():
+    legacy = struct.pack("<III", 3, 2, 1) + PIXELS
+    with_dataspace = struct.pack("<IIII", 3, 2, 1, 0) + PIXELS
+
+    for data in (legacy, with_dataspace):
+        w, h, fmt, pixels = AdbManager.parse_raw_screencap(data)
+        assert (w, h, fmt) == (3, 2, 1)
+        assert bytes(pixels) == PIXELS
+
+    assert AdbManager.parse_raw_screencap(struct.pack("<III", 3, 2, 4) + PIXELS) is None
+    assert AdbManager.parse_raw_screencap(legacy[:-1]) is None
+    assert AdbManager.parse_raw_screencap(b"\x89PNG\r\n") is None
+
+
+def test_video_thread_builds_frames_from_raw_capture(monkeypatch):
+    data = struct.pack("<IIII", 3, 2, 1, 0) + PIXELS
+    monkeypatch.setattr(live_mirror.AdbManager, "get_screenshot_raw", lambda _s: AdbManager.parse_raw_screencap(data))
+    monkeypatch.setattr(live_mirror.AdbManager, "get_screenshot_bytes", lambda _s: None)
+
+    frame, decode = VideoThread("SERIAL").capture()
+    img = decode()
+    # Compared by memcmp in run(): the backing buffer, never a memoryview
+    w, h, fmt, buf = frame
+    assert (w, h, fmt) == (3, 2, 1)
+    assert type(buf) in (bytes, bytearray) and buf.endswith(PIXELS)
+    assert (img.width(), img.height()) == (3, 2)
+    assert img.pixelColor(2, 1).getRgb() == (10, 20, 30, 255)
+
+
+FAKE_SHELL = (
+    "import struct, sys\n"
+    "frame = struct.pack('<IIII', 3, 2, 1, 0) + bytes([10, 20, 30, 255]) * 6\n"
+    "for line in sys.stdin.buffer:\n"
+    "    if line.startswith(b'exit'):\n"
+    "        break\n"
+    "    sys.stdout.buffer.write(frame)\n"
+    "    sys.stdout.buffer.flush()\n"
+)
+
+
+def test_capture_session_reads_consecutive_frames_from_one_shell():
+    session = RawCaptureSession("SERIAL", header_size=16, argv=[sys.executable, "-c", FAKE_SHELL])
+    try:
+        proc = session.proc
+        for _ in range(3):
+            w, h, fmt, pixels = session.capture()
+            assert (w, h, fmt) == (3, 2, 1)
+            assert bytes(pixels) == PIXELS
+        assert session.proc is proc
+    finally:
+        session.close()
+    assert session.capture() is None
+
+
+def test_capture_session_rejects_out_of_sync_stream():
+    script = "import sys\nsys.stdin.buffer.readline()\nsys.stdout.buffer.write(b'screencap\\r\\n' * 4)\n"
+    session = RawCaptureSession("SERIAL", header_size=16, argv=[sys.executable, "-c", script])
+    try:
+        assert session.capture() is None
+    finally:
+        session.close()
+
+
+def test_video_thread_backs_off_slow_captures_and_recovers():
+    thread = VideoThread("SERIAL", target_fps=8)
+    for i in range(3):
+        thread.adapt_rate(0.5, now=float(i))
+    assert thread.effective_fps == 5
+
+    thread.adapt_rate(0.01, now=4.0)
+    assert thread.effective_fps == 5
+    thread.adapt_rate(0.01, now=7.0)
+    assert thread.effective_fps == 6
+    thread.adapt_rate(0.01, now=8.0)
+    assert thread.effective_fps == 6
+
+    thread.set_target_fps(3)
+    assert thread.effective_fps == 3
+    thread.adapt_rate(0.01, now=100.0)
+    assert thread.effective_fps == 3
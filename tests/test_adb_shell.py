@@ -0,0 +1,77 @@
+import shutil
+import threading
+
+import pytest
+
+from qa_snapshot_tool.adb_manager import AdbManager, PersistentAdbShell
+
+
+pytestmark = pytest.mark.skipif(shutil.which("sh") is None, reason="needs a POSIX shell")
+
+
+def test_persistent_shell_runs_commands_in_one_process():
+    shell = PersistentAdbShell("SERIAL", argv=["sh"])
+    try:
+        first = shell.run(["echo", "hello world"])
+        proc = shell.proc
+        second = shell.run(["printf", "no newline"])
+        failed = shell.run(["sh", "-c", "echo oops >&2; exit 3"])
+
+        assert first.returncode == 0 and first.stdout == "hello world\n"
+        assert second.stdout == "no newline"
+        assert failed.returncode == 3 and failed.stdout == "oops\n"
+        assert shell.proc is proc
+    finally:
+        shell.close()
+
+
+def test_persistent_shell_restarts_after_timeout():
+    shell = PersistentAdbShell("SERIAL", argv=["sh"])
+    try:
+        timed_out = shell.run(["sleep", "5"], timeout=0.2)
+        assert timed_out.returncode == -1 and timed_out.stdout == ""
+        assert shell.proc is None
+        assert shell.run(["echo", "back"]).stdout == "back\n"
+    finally:
+        shell.close()
+
+
+def test_persistent_shell_ignores_echoed_command_lines():
+    # Like a pty-backed `adb shell`: every input line is echoed to stdout before it runs
+    shell = PersistentAdbShell("SERIAL", argv=["sh", "-c", "exec 2>&1; exec sh -v"])
+    try:
+        failed = shell.run(["sh", "-c", "echo out; exit 3"])
+        assert failed.returncode == 3
+        assert failed.stdout.endswith("out\n")
+        assert "__QA_END_" not in failed.stdout.splitlines()[-1]
+    finally:
+        shell.close()
+
+
+_real_start = PersistentAdbShell._start
+
+
+def _start_local_sh(self):
+    # AdbManager builds its shells with the adb argv; run a local sh instead
+    self.argv = ["sh"]
+    return _real_start(self)
+
+
+def test_shell_timeout_is_not_rerun_and_threads_get_their_own_shell(monkeypatch):
+    fallback = []
+    monkeypatch.setattr(AdbManager, "_run_cmd", lambda cmd, timeout=10: fallback.append(cmd))
+    monkeypatch.setattr(AdbManager, "_shells", {})
+    monkeypatch.setattr(PersistentAdbShell, "_start", _start_local_sh)
+    try:
+        res = AdbManager._run_shell("SERIAL", ["sleep", "5"], timeout=0.2)
+        assert res.returncode == -1 and fallback == []
+
+        shells = []
+        worker = threading.Thread(target=lambda: shells.append(AdbManager._shell_for("SERIAL")))
+        worker.start()
+        worker.join()
+        assert shells[0] is not AdbManager._shell_for("SERIAL")
+    finally:
+        AdbManager.close_shells("SERIAL")
+    assert AdbManager._shells == {}
+
@@ -101,3 +101,16 @@ def test_event_capture_records_frame_and_xml_when_available():
     assert ws.recorder.events == [("dump_error", {"message": "x"})]
     assert ws.recorder.frames == ["event_dump_error"]
     assert ws.recorder.xmls == ["event_dump_error"]
+
+
+def test_viewport_swap_keeps_mouse_tracking():
+    from PySide6.QtWidgets import QApplication, QGraphicsScene
+
+    from qa_snapshot_tool.gui import SmartGraphicsView
+
+    app = QApplication.instance() or QApplication([])
+    view = SmartGraphicsView(QGraphicsScene())
+    assert view.viewport().hasMouseTracking()
+    for enabled in (True, False):
+        view.set_opengl_enabled(enabled)
+        assert view.viewport().hasMouseTracking()
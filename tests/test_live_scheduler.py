@@ -1,4 +1,12 @@
-﻿from qa_snapshot_tool.live_mirror import FocusMonitorThread, HierarchyThread, LogcatThread
+﻿import io
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from qa_snapshot_tool import live_mirror
+from qa_snapshot_tool.live_mirror import FocusMonitorThread, HierarchyThread, LogcatThread
 
 
 def test_hierarchy_poll_interval_has_lower_bound():
@@ -7,13 +15,207 @@ def test_hierarchy_poll_interval_has_lower_bound():
     assert thread.poll_interval_s >= 0.2
 
 
+def test_hierarchy_thread_emits_parsed_tree(monkeypatch):
+    xml = '<hierarchy><node class="android.widget.Button" bounds="[0,0][100,100]" /></hierarchy>'
+    thread = HierarchyThread("SERIAL")
+
+    def dump(_serial):
+        thread.running = False
+        return xml
+
+    monkeypatch.setattr(live_mirror.AdbManager, "get_xml_dump", dump)
+    emitted = []
+    thread.tree_ready.connect(lambda *args: emitted.append(args))
+    thread.run()
+
+    assert len(emitted) == 1
+    xml_str, changed, (root, parse_err) = emitted[0]
+    assert xml_str == xml and changed is True
+    assert root.class_name == "android.widget.Button" and parse_err is False
+
+
+def test_hierarchy_poll_backs_off_while_unchanged():
+    thread = HierarchyThread("SERIAL")
+    thread.set_poll_interval(0.5)
+    assert [thread.idle_interval(n) for n in range(6)] == [0.5, 1.0, 2.0, 4.0, 4.0, 4.0]
+    thread.set_poll_interval(1.5)
+    assert thread.idle_interval(0) == 1.5
+    assert thread.idle_interval(10) == 5.0
+
+
 def test_focus_poll_interval_has_lower_bound():
     thread = FocusMonitorThread("SERIAL")
     thread.set_poll_interval(0.01)
     assert thread.poll_interval_s >= 0.2
 
 
+def test_focus_poll_backs_off_while_unchanged():
+    thread = FocusMonitorThread("SERIAL")
+    thread.set_poll_interval(1.0)
+    intervals = [thread.idle_interval(n) for n in range(8)]
+    assert intervals[0] == 1.0
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == 5.0
+    thread.set_poll_interval(2.5)
+    assert thread.idle_interval(0) == 2.5
+    assert thread.idle_interval(10) == 5.0
+
+
 def test_logcat_emit_every_n_has_lower_bound():
     thread = LogcatThread("SERIAL")
     thread.set_emit_every_n(0)
     assert thread.emit_every_n == 1
+
+
+def test_logcat_reads_chunks_and_emits_line_batches(monkeypatch):
+    script = "import sys; sys.stdout.write(''.join(f'line {i}\\r\\n' for i in range(450)) + '\\n  \\npartial')"
+    real_popen = subprocess.Popen
+    monkeypatch.setattr(live_mirror.subprocess, "run", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        live_mirror.subprocess,
+        "Popen",
+        lambda cmd, **kwargs: real_popen([sys.executable, "-c", script], **kwargs),
+    )
+    thread = LogcatThread("SERIAL")
+    batches = []
+    thread.log_lines.connect(batches.append)
+    thread.run()
+
+    lines = [line for batch in batches for line in batch]
+    assert lines == [f"line {i}" for i in range(450)] + ["partial"]
+    assert max(len(batch) for batch in batches) <= LogcatThread.batch_size
+
+
+def test_replayable_reader_replays_until_released():
+    reader = live_mirror._ReplayableReader(io.BytesIO(b"abcdefgh"))
+    assert reader.read(3) == b"abc"
+    reader.rewind()
+    assert reader.read(2) == b"ab"
+    reader.release()
+    assert reader.read(4) == b"c"
+    assert reader.read(4) == b"defg"
+    assert reader.recorded == bytearray()
+
+
+def test_replayable_reader_returns_partial_pipe_reads_and_stops_on_request():
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "import sys, time; sys.stdout.buffer.write(b'abc'); sys.stdout.flush(); time.sleep(5)"],
+        stdout=subprocess.PIPE,
+    )
+    running = [True]
+    try:
+        reader = live_mirror._ReplayableReader(proc.stdout, lambda: running[0])
+        assert reader.read(32768) == b"abc"
+        running[0] = False
+        assert reader.read(32768) == b""
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def test_scrcpy_frames_wrap_padded_rgb_plane_without_numpy():
+    av = pytest.importorskip("av")
+    src = av.VideoFrame(30, 10, "rgb24")
+    src.planes[0].update(bytes([200, 100, 50]) * (src.planes[0].buffer_size // 3))
+    frame = src.reformat(format="yuv420p")
+
+    reformatter = av.video.reformatter.VideoReformatter()
+    images = [live_mirror.ScrcpyVideoSource._frame_to_qimage(frame, reformatter) for _ in range(2)]
+    images.append(live_mirror.ScrcpyVideoSource._frame_to_qimage(frame))
+    del src, frame
+    for img in images:
+        assert (img.width(), img.height()) == (30, 10)
+        r, g, b, _ = img.pixelColor(29, 9).getRgb()
+        assert abs(r - 200) <= 2 and abs(g - 100) <= 2 and abs(b - 50) <= 2
+
+
+def test_hierarchy_refresh_request_cuts_the_poll_wait_short(monkeypatch):
+    thread = HierarchyThread("SERIAL")
+    thread.set_poll_interval(30.0)
+    calls = []
+
+    def dump(_serial):
+        calls.append(1)
+        if len(calls) == 1:
+            thread.request_refresh()
+        else:
+            thread.running = False
+        return None
+
+    monkeypatch.setattr(live_mirror.AdbManager, "get_xml_dump", dump)
+    monkeypatch.setattr(live_mirror.AdbManager, "get_last_dump_error", lambda: None)
+    thread.run()
+    assert len(calls) == 2
+
+
+def test_scrcpy_raw_stream_requests_low_latency_h264():
+    source = live_mirror.ScrcpyVideoSource("SERIAL", max_fps=30, bitrate=8_000_000)
+    cmd = source._raw_stream_cmd("scrcpy")
+    assert "--video-codec=h264" in cmd
+    assert cmd[cmd.index("--video-codec-options") + 1] == "profile=1,i-frame-interval=1"
+    assert cmd[cmd.index("--video-bit-rate") + 1] == "2000000"
+    assert cmd[cmd.index("--max-fps") + 1] == "30"
+
+
+def test_scrcpy_window_capture_skips_unchanged_frames(monkeypatch):
+    from PySide6.QtGui import QImage
+
+    def solid(argb):
+        img = QImage(4, 4, QImage.Format_RGB32)
+        img.fill(argb)
+        return img
+
+    frames = [solid(0xFF112233), solid(0xFF112233), solid(0xFF445566), solid(0xFF445566)]
+    source = live_mirror.ScrcpyVideoSource("SERIAL", max_fps=1000)
+    source._running = True
+
+    def capture(_hwnd):
+        img = frames.pop(0)
+        if not frames:
+            source._running = False
+        return img
+
+    monkeypatch.setattr(source, "_find_window_handle", lambda *args, **kwargs: 1)
+    monkeypatch.setattr(source, "_capture_window_image", capture)
+    monkeypatch.setattr(source, "_release_dib_cache", lambda: None)
+    emitted = []
+    source.frame_ready.connect(emitted.append)
+    source._capture_window_loop()
+
+    assert [img.pixel(0, 0) for img in emitted] == [0xFF112233, 0xFF445566]
+
+
+def test_scrcpy_source_paints_the_newest_frame_last():
+    from PySide6.QtCore import QObject, Slot
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+
+    class Receiver(QObject):
+        def __init__(self):
+            super().__init__()
+            self.painted = []
+
+        @Slot(object)
+        def paint(self, img):
+            self.painted.append(img)
+
+    source = live_mirror.ScrcpyVideoSource("SERIAL")
+    receiver = Receiver()
+    source.frame_ready.connect(receiver.paint)
+
+    # Offered from a decoder thread while the GUI thread is busy: f2 is replaced by f3
+    decoder = threading.Thread(target=lambda: [source._offer_frame(f) for f in ("f1", "f2", "f3")])
+    decoder.start()
+    decoder.join()
+    for _ in range(5):
+        app.processEvents()
+    assert receiver.painted == ["f1", "f3"]
+
+    # Once drained, the next frame goes straight out again
+    decoder = threading.Thread(target=source._offer_frame, args=("f4",))
+    decoder.start()
+    decoder.join()
+    for _ in range(5):
+        app.processEvents()
+    assert receiver.painted == ["f1", "f3", "f4"]
@@ -0,0 +1,40 @@
+"""
+Unit tests for the locator suggester helpers.
+"""
+
+from qa_snapshot_tool.locator_suggester import LocatorSuggester, LocatorUtils
+from qa_snapshot_tool.uix_parser import UixParser
+
+
+class TestEscapeXpathString:
+    def test_plain_text_is_single_quoted(self):
+        assert LocatorUtils.escape_xpath_string("Sign in") == "'Sign in'"
+
+    def test_quotes_become_concat(self):
+        assert LocatorUtils.escape_xpath_string("User's") == "concat('User', \"'\", 's')"
+        assert LocatorUtils.escape_xpath_string("'a'") == "concat('', \"'\", 'a', \"'\", '')"
+
+
+class TestScopedLocator:
+    XML = (
+        '<hierarchy>'
+        '<node class="android.widget.FrameLayout" resource-id="com.app:id/list" bounds="[0,0][100,200]">'
+        '<node class="android.widget.FrameLayout" resource-id="android:id/content" bounds="[0,0][100,200]">'
+        '<node class="android.widget.Button" text="OK" bounds="[0,0][50,50]" />'
+        '<node class="android.widget.Button" text="Cancel" bounds="[50,0][100,50]" />'
+        '</node>'
+        '</node>'
+        '</hierarchy>'
+    )
+
+    def test_anchor_skips_generic_ids_and_is_shared_by_siblings(self):
+        root, _ = UixParser.parse(self.XML)
+        content = root.children[0]
+        ok, cancel = content.children
+
+        assert LocatorSuggester._find_anchor(ok) is root
+        assert LocatorSuggester._find_anchor(cancel) is root
+        assert LocatorSuggester._find_anchor(root) is None
+        scoped = LocatorSuggester._generate_scoped_locator(cancel)
+        assert scoped["xpath"].startswith("//*[@resource-id='com.app:id/list']")
+        assert "Cancel" in scoped["xpath"]
@@ -1,4 +1,4 @@
-from qa_snapshot_native import compress_payload, frame_sha1, smallest_hit, sort_rects_by_area
+from qa_snapshot_native import build_hit_grid, compress_payload, first_hit, frame_sha1, smallest_hit, sort_rects_by_area
 
 
 def test_frame_sha1_is_deterministic():
@@ -33,3 +33,38 @@ def test_sort_rects_by_area_orders_small_to_large():
     ]
     ordered = sort_rects_by_area(rects)
     assert [item[1] for item in ordered] == ["b", "c", "a"]
+
+
+def test_first_hit_on_area_sorted_rects_matches_smallest_hit():
+    rects = [
+        ((0, 0, 100, 100), "root"),
+        ((10, 10, 40, 40), "container"),
+        ((20, 20, 10, 10), "leaf"),
+    ]
+    ordered = sort_rects_by_area(rects)
+    for x, y in ((25, 25), (12, 12), (90, 90), (101, 101)):
+        assert first_hit(ordered, x, y) == smallest_hit(rects, x, y)
+
+
+def test_hit_grid_matches_linear_scan():
+    rects = [
+        ((0, 0, 1080, 1920), "root"),
+        ((0, 100, 1080, 300), "header"),
+        ((40, 120, 200, 80), "button"),
+        ((500, 1500, 256, 256), "fab"),
+    ]
+    grid = build_hit_grid(sort_rects_by_area(rects), cell_size=64)
+    for x, y in ((50, 130), (240, 200), (600, 1600), (756, 1756), (10, 10), (1200, 10)):
+        assert grid.hit(x, y) == smallest_hit(rects, x, y)
+
+
+def test_hit_grid_clips_oversized_rects_to_extent():
+    rects = sort_rects_by_area([
+        ((0, 0, 1080, 1920), "root"),
+        ((-10**9, -10**9, 2 * 10**9, 2 * 10**9), "bogus"),
+        ((40, 120, 200, 80), "button"),
+    ])
+    grid = build_hit_grid(rects, cell_size=64, extent=(0, 0, 1080, 1920))
+    assert len(grid.cells) == (1080 // 64 + 1) * (1920 // 64 + 1)
+    assert grid.hit(50, 130) == "button"
+    assert grid.hit(500, 500) == "root"
@@ -28,6 +28,25 @@ class TestUixParser:
         assert error is True
         assert root.valid_bounds is False
 
+    def test_offset_and_garbled_bounds(self):
+        """Test negative offsets parse into (x, y, w, h) and junk bounds stay invalid."""
+        xml = '<hierarchy><node bounds="[-20,30][80,130]"><node bounds="[1,2]" /></node></hierarchy>'
+        root, _ = UixParser.parse(xml)
+
+        assert root.rect == (-20, 30, 100, 100) and root.valid_bounds is True
+        assert root.children[0].rect == (0, 0, 0, 0) and root.children[0].valid_bounds is False
+
+    def test_declaration_and_shell_noise_are_trimmed(self):
+        """Test dumps wrapped in an XML declaration and adb output still parse."""
+        xml = (b"UI hierchary dumped to: /dev/tty\n<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>"
+               b'<hierarchy rotation="0"><node text="OK" bounds="[0,0][10,10]" /></hierarchy>\n')
+        root, error = UixParser.parse(xml)
+        assert root is not None and not error
+        assert root.text == "OK"
+
+        root, error = UixParser.parse("<?xml version='1.0' ?><node text=\"bare\" bounds=\"[0,0][5,5]\" />")
+        assert root is not None and root.text == "bare"
+
     def test_malformed_xml(self):
         """Test resilience against bad XML."""
         xml = '<hierarchy><node bounds="...">'  # Missing closing tag
@@ -43,3 +62,19 @@ class TestUixParser:
 
         assert root is not None
         assert root.text == "Menü"
+
+    def test_deep_nesting_keeps_child_order(self):
+        """Test that dumps deeper than the recursion limit still parse in order."""
+        depth = 3000
+        inner = '<node text="a" bounds="[0,0][1,1]" /><node text="b" bounds="[0,0][1,1]" />'
+        xml = '<hierarchy>' + '<node bounds="[0,0][10,10]">' * depth + inner + '</node>' * depth + '</hierarchy>'
+        root, error = UixParser.parse(xml)
+
+        assert root is not None
+        assert not error
+        node = root
+        for _ in range(depth - 1):
+            assert len(node.children) == 1
+            node = node.children[0]
+        assert [c.text for c in node.children] == ["a", "b"]
+        assert node.children[1].parent is node
@@ -133,3 +133,22 @@ def test_start_session_sanitizes_serial_for_windows_paths(tmp_path: Path):
     assert "?" not in recorder.session_dir.name
     assert "*" not in recorder.session_dir.name
     assert ":" not in recorder.session_dir.name
+
+
+def test_record_log_lines_writes_batch_to_file_and_db(tmp_path: Path):
+    recorder = SessionRecorder.start_session(
+        session_root=tmp_path / "sessions",
+        serial="LOG01",
+        model="RackModel",
+        environment_type="rack",
+        profile="rack_aaos",
+        display_id=None,
+        session_max_bytes=1024 * 1024 * 1024,
+    )
+    recorder.record_log_lines(["first", "second", "third"])
+    recorder.record_log_line("fourth", source="scrcpy")
+    recorder.finish_session("stopped")
+
+    lines = recorder.log_path.read_text(encoding="utf-8").splitlines()
+    assert [line.split("] ", 1)[1] for line in lines] == ["first", "second", "third", "fourth"]
+    assert _count_rows(recorder.db_path, "logs") == 4
@@ -0,0 +1,95 @@
+import os
+from pathlib import Path
+
+from qa_snapshot_tool import snapshot_cache
+from qa_snapshot_tool.uix_parser import UixParser
+
+
+XML = (
+    '<hierarchy>'
+    '<node class="android.widget.FrameLayout" bounds="[0,0][100,200]">'
+    '<node class="android.widget.Button" text="OK" bounds="[10,60][90,90]" />'
+    '</node>'
+    '</hierarchy>'
+)
+
+
+def test_tree_cache_round_trips_and_invalidates_on_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+    dump = tmp_path / "dump.uix"
+    dump.write_text(XML, encoding="utf-8")
+
+    assert snapshot_cache.load_tree(str(dump)) is None
+    root, is_error = UixParser.parse(XML)
+    snapshot_cache.store_tree(str(dump), root, is_error)
+
+    cached = snapshot_cache.load_tree(str(dump))
+    assert cached is not None
+    cached_root, cached_error = cached
+    assert cached_error is False
+    button = cached_root.children[0]
+    assert button.text == "OK" and button.parent is cached_root
+    assert button.fingerprint == root.children[0].fingerprint
+
+    dump.write_text(XML.replace("OK", "Cancel"), encoding="utf-8")
+    os.utime(dump, ns=(1, 1))
+    assert snapshot_cache.load_tree(str(dump)) is None
+
+
+def test_prune_keeps_newest_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+    base = snapshot_cache.cache_dir()
+    for i in range(5):
+        entry = base / f"{i}.uix.pkl"
+        entry.write_bytes(b"x")
+        os.utime(entry, (i, i))
+
+    snapshot_cache.prune(max_files=2)
+    assert sorted(p.name for p in base.iterdir()) == ["3.uix.pkl", "4.uix.pkl"]
+
+
+def test_prune_enforces_byte_cap_oldest_first(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+    base = snapshot_cache.cache_dir()
+    for i in range(4):
+        entry = base / f"{i}.png"
+        entry.write_bytes(b"x" * 100)
+        os.utime(entry, (i, i))
+
+    snapshot_cache.prune(max_files=10, max_bytes=250)
+    assert sorted(p.name for p in base.iterdir()) == ["2.png", "3.png"]
+
+
+def test_tree_cache_rejects_entries_for_another_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+    dump = tmp_path / "dump.uix"
+    dump.write_text(XML, encoding="utf-8")
+    root, is_error = UixParser.parse(XML)
+    snapshot_cache.store_tree(str(dump), root, is_error)
+    entry = snapshot_cache.cache_dir() / f"{snapshot_cache.cache_key(str(dump))}.uix.pkl"
+
+    other = tmp_path / "other.uix"
+    other.write_text(XML, encoding="utf-8")
+    snapshot_cache.store_tree(str(other), root, is_error)
+    other_entry = snapshot_cache.cache_dir() / f"{snapshot_cache.cache_key(str(other))}.uix.pkl"
+    entry.write_bytes(other_entry.read_bytes())
+    assert snapshot_cache.load_tree(str(dump)) is None
+
+    entry.write_bytes(b"not a pickle")
+    assert snapshot_cache.load_tree(str(dump)) is None
+
+
+def test_cached_image_is_compressed(tmp_path, monkeypatch):
+    from PySide6.QtGui import QColor, QImage
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+    source = tmp_path / "screenshot.png"
+    width, height = 540, 1200
+    img = QImage(width, height, QImage.Format_RGB32)
+    img.fill(QColor("#202020"))
+    img.save(str(source))
+
+    target = snapshot_cache.image_path(str(source), width, height)
+    snapshot_cache.store_image(target, img)
+    assert target.stat().st_size * 20 < width * height * 4
+    assert snapshot_cache.load_image(target).size() == img.size()
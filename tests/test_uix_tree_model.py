@@ -0,0 +1,56 @@
+from PySide6.QtCore import QModelIndex
+from PySide6.QtTest import QAbstractItemModelTester
+
+from qa_snapshot_tool.uix_parser import UixParser
+from qa_snapshot_tool.uix_tree_model import UixTreeModel
+
+
+XML = (
+    '<hierarchy>'
+    '<node class="android.widget.FrameLayout" resource-id="app:id/root" bounds="[0,0][100,200]">'
+    '<node class="android.widget.TextView" text="Hello" bounds="[0,0][100,50]" />'
+    '<node class="android.widget.LinearLayout" bounds="[0,50][100,200]">'
+    '<node class="android.widget.Button" text="OK" bounds="[10,60][90,90]" />'
+    '</node>'
+    '</node>'
+    '</hierarchy>'
+)
+
+
+def test_model_exposes_uinode_tree_without_copying():
+    root, _ = UixParser.parse(XML)
+    model = UixTreeModel("UI Tree")
+    QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    model.set_root(root)
+
+    assert model.node_count() == 4
+    assert model.rowCount(QModelIndex()) == 1
+    top = model.index(0, 0)
+    assert model.node(top) is root
+    assert model.data(top) == "FrameLayout (root)"
+    assert model.rowCount(top) == 2
+
+    layout = model.index(1, 0, top)
+    button = model.index(0, 0, layout)
+    assert model.node(button) is root.children[1].children[0]
+    assert model.data(button) == 'Button "OK"'
+    assert model.node(model.parent(button)) is root.children[1]
+    assert model.parent(top) == QModelIndex()
+
+
+def test_index_for_node_rejects_nodes_from_a_previous_tree():
+    old_root, _ = UixParser.parse(XML)
+    new_root, _ = UixParser.parse(XML)
+    model = UixTreeModel()
+    model.set_root(new_root)
+
+    button = new_root.children[1].children[0]
+    index = model.index_for_node(button)
+    assert index.isValid() and index.row() == 0
+    assert model.node(index) is button
+    assert not model.contains(old_root.children[1].children[0])
+    assert not model.index_for_node(old_root).isValid()
+
+    model.set_root(None)
+    assert model.rowCount(QModelIndex()) == 0
+    assert not model.contains(new_root)
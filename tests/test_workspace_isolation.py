@@ -46,8 +46,9 @@ def test_workspace_log_tree_frame_updates_are_isolated_by_serial():
     assert window.txt_log.lines == []
 
     # Background workspace tree should not trigger active tree rendering.
-    MainWindow.on_workspace_tree(window, "B", "<hierarchy/>", True)
+    MainWindow.on_workspace_tree(window, "B", "<hierarchy/>", True, ("root-b", False))
     assert ws_b.last_xml == "<hierarchy/>"
+    assert ws_b.last_tree == ("root-b", False)  # reused instead of reparsed on switch
     assert tree_calls == []
 
     # Background workspace frame should be cached only in that workspace.